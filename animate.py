@@ -0,0 +1,216 @@
+import argparse
+import datetime
+import math
+from pathlib import Path
+
+import plotly.graph_objects as go
+
+from charts import CHARTS_BY_NAME, HEIGHT, WIDTH, build_figure, export_figures
+from history import PRICES_SERIES, HistoryStore, month_ends, score_series
+
+FORMATS = ("html", "gif", "mp4")
+# Milliseconds each date is shown for
+FRAME_DURATION = 800
+
+
+def build_frames(history, chart, dates):
+    """Rebuild a chart's data and frontier at each date.
+
+    Consecutive dates that resolve to the same price and score snapshots
+    reuse the previous frame instead of loading and sweeping it again.
+    Returns a list of (date, df, pareto_models).
+    """
+    frames = []
+    previous_key = None
+    for date in dates:
+        key = (
+            history.as_of(score_series(chart["name"]), date),
+            history.as_of(PRICES_SERIES, date),
+        )
+        if key[0] is None:
+            continue
+        if key == previous_key:
+            _, df, pareto_models = frames[-1]
+        else:
+            df, pareto_models = history.chart_data(chart, date)
+        frames.append((str(date), df, pareto_models))
+        previous_key = key
+    return frames
+
+
+def frame_figures(chart, frames):
+    """Build one figure per frame, all sharing the same axis ranges."""
+    costs = [c for _, df, _ in frames for c in df["cost"] if c > 0]
+    scores = [s for _, df, _ in frames for s in df[chart["score"]]]
+    margin = (max(scores) - min(scores)) * 0.05 or 1
+    x_range = [math.log10(min(costs)) - 0.1, math.log10(max(costs)) + 0.1]
+    y_range = [min(scores) - margin, max(scores) + margin]
+
+    figures = []
+    for date, df, pareto_models in frames:
+        fig = build_figure(chart, df, pareto_models)
+        fig.update_layout(
+            title=f"{chart['title']} ({date})",
+            xaxis_range=x_range,
+            yaxis_range=y_range,
+        )
+        figures.append(fig)
+    return figures
+
+
+def build_animation(chart, frames):
+    """Combine the frames into one Plotly figure with a play button and date slider."""
+    figures = frame_figures(chart, frames)
+    dates = [date for date, _, _ in frames]
+    fig = go.Figure(
+        data=figures[0].data,
+        layout=figures[0].layout,
+        frames=[
+            go.Frame(data=f.data, layout=dict(title=f.layout.title), name=date)
+            for date, f in zip(dates, figures)
+        ],
+    )
+    play = dict(frame=dict(duration=FRAME_DURATION, redraw=True), fromcurrent=True)
+    fig.update_layout(
+        updatemenus=[
+            dict(
+                type="buttons",
+                showactive=False,
+                x=0,
+                y=-0.1,
+                xanchor="left",
+                buttons=[
+                    dict(label="Play", method="animate", args=[None, play]),
+                    dict(
+                        label="Pause",
+                        method="animate",
+                        args=[[None], dict(mode="immediate")],
+                    ),
+                ],
+            )
+        ],
+        sliders=[
+            dict(
+                x=0.1,
+                len=0.9,
+                y=-0.05,
+                steps=[
+                    dict(
+                        label=date,
+                        method="animate",
+                        args=[[date], dict(mode="immediate")],
+                    )
+                    for date in dates
+                ],
+            )
+        ],
+    )
+    return fig
+
+
+def render_frames(figures, paths, jobs=None):
+    """Export frame figures to PNGs in parallel, one kaleido session per worker.
+
+    Raises RuntimeError listing the frames that failed.
+    """
+    results = export_figures(
+        [(fig.to_json(), path, (WIDTH, HEIGHT)) for fig, path in zip(figures, paths)],
+        jobs,
+    )
+    failed = [f"{r['path']}: {r['error']}" for r in results if r["error"]]
+    if failed:
+        raise RuntimeError("Could not render frames:\n" + "\n".join(failed))
+
+
+def write_gif(paths, output, duration=FRAME_DURATION):
+    """Stitch PNG frames into a looping GIF (requires Pillow)."""
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("GIF export requires Pillow: pip install pillow") from None
+
+    images = [Image.open(path) for path in paths]
+    images[0].save(
+        output, save_all=True, append_images=images[1:], duration=duration, loop=0
+    )
+
+
+def write_mp4(paths, output, duration=FRAME_DURATION):
+    """Stitch PNG frames into an MP4 video (requires imageio with ffmpeg)."""
+    try:
+        import imageio.v2 as imageio
+    except ImportError:
+        raise ImportError(
+            "MP4 export requires imageio: pip install 'imageio[ffmpeg]'"
+        ) from None
+
+    with imageio.get_writer(output, fps=1000 / duration) as writer:
+        for path in paths:
+            writer.append_data(imageio.imread(path))
+
+
+def export_animation(chart, frames, output, jobs=None):
+    """Write a chart's frontier evolution as HTML, GIF or MP4, by `output`'s suffix."""
+    output = Path(output)
+    # Check before rendering any frames
+    if output.suffix.lstrip(".") not in FORMATS:
+        raise ValueError(f"Unsupported animation format: {output.suffix!r}")
+    if not frames:
+        raise ValueError("No frames to animate")
+    if output.suffix == ".html":
+        build_animation(chart, frames).write_html(output, auto_play=False)
+        return
+
+    frame_dir = output.with_name(output.stem + "-frames")
+    frame_dir.mkdir(parents=True, exist_ok=True)
+    paths = [frame_dir / f"{date}.png" for date, _, _ in frames]
+    render_frames(frame_figures(chart, frames), paths, jobs)
+    if output.suffix == ".gif":
+        write_gif(paths, output)
+    else:
+        write_mp4(paths, output)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Animate how a chart's frontier moved over the recorded history."
+    )
+    parser.add_argument("chart", choices=sorted(CHARTS_BY_NAME))
+    parser.add_argument("--start", help="First date (default: first snapshot).")
+    parser.add_argument(
+        "--end", default=datetime.date.today().isoformat(), help="Last date."
+    )
+    parser.add_argument("--format", choices=FORMATS, default="html")
+    parser.add_argument(
+        "--output", help="Output file (default: pareto-<chart>-history.<format>)."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for GIF/MP4 frames (default: one per CPU core).",
+    )
+    args = parser.parse_args()
+
+    chart = CHARTS_BY_NAME[args.chart]
+    history = HistoryStore()
+    dates = history.dates(score_series(chart["name"]))
+    if not dates:
+        parser.error(
+            f"no {chart['name']} history; run 'python history.py record' first"
+        )
+    output = args.output or f"pareto-{chart['name']}-history.{args.format}"
+    if Path(output).suffix.lstrip(".") not in FORMATS:
+        parser.error(f"--output must end in one of: .{', .'.join(FORMATS)}")
+    start = args.start or dates[0]
+    if args.end < start:
+        parser.error(f"--end {args.end} is before the start date {start}")
+    frames = build_frames(history, chart, month_ends(start, args.end))
+    if not frames:
+        parser.error(f"no {chart['name']} snapshots on or before {args.end}")
+    export_animation(chart, frames, output, args.jobs)
+    print(f"Wrote {len(frames)} frames to {output}")
+
+
+if __name__ == "__main__":
+    main()
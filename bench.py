@@ -0,0 +1,248 @@
+import argparse
+import datetime
+import json
+import platform
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import plotly
+
+from charts import HEIGHT, WIDTH, build_figure
+from frontier import find_pareto_models
+from pricing import (
+    PRICES_PATH,
+    PricingStore,
+    PricingWarning,
+    get_cost_model,
+    get_model_cost,
+)
+from specs import CHARTS_BY_NAME, engine_hash
+
+SIZES = (10, 1_000, 100_000, 1_000_000)
+STAGES = (
+    "dataframe",
+    "pricing_load",
+    "pricing_lookup",
+    "pricing_batch",
+    "frontier",
+    "figure",
+    "write_image",
+)
+# Share of synthetic rows whose pricing key isn't in llm-prices.json
+UNKNOWN_SHARE = 0.1
+# Timings under this many seconds are too noisy to call a regression
+MIN_SECONDS = 0.001
+
+# Synthetic leaderboards are plotted with the aider chart's spec
+CHART = dict(CHARTS_BY_NAME["aider"], name="bench", output="bench.png")
+
+
+def synthetic_leaderboard(n, store, seed=0):
+    """Columns of an n-row leaderboard shaped like the real ones.
+
+    Pricing keys are drawn from llm-prices.json (plus UNKNOWN_SHARE of names
+    it doesn't know), efforts from the effort tiers, and scores rise with a
+    log-normal cost plus noise.
+    """
+    rng = np.random.default_rng(seed)
+    names = np.array(list(store.by_name), dtype=object)
+    keys = names[rng.integers(len(names), size=n)]
+    unknown = rng.random(n) < UNKNOWN_SHARE
+    keys[unknown] = [f"synthetic-model-{i}" for i in np.flatnonzero(unknown)]
+    efforts = np.array([None, "thinking", "high"], dtype=object)[
+        rng.choice(3, size=n, p=[0.6, 0.3, 0.1])
+    ]
+    cost = rng.lognormal(mean=0.0, sigma=1.5, size=n)
+    score = np.clip(50 + 10 * np.log10(cost) + rng.normal(0, 8, size=n), 0, 100)
+    return {
+        "model": [f"{key} #{i}" for i, key in enumerate(keys)],
+        "pricing_key": keys.tolist(),
+        "effort": efforts.tolist(),
+        "cost": cost,
+        CHART["score"]: score,
+    }
+
+
+def measure(function, repeat):
+    """Run `function` `repeat` times; returns (last result, seconds per run)."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        runs.append(time.perf_counter() - start)
+    return result, runs
+
+
+def bench_size(n, stages=STAGES, repeat=3, seed=0):
+    """Time each pipeline stage on an n-row synthetic leaderboard.
+
+    Stages run in pipeline order and each feeds the next, so a later stage
+    times the same inputs the real pipeline would hand it. Returns one result
+    per stage: {"rows", "stage", "seconds" (best run), "runs"} plus "error"
+    if the stage raised.
+    """
+    store = PricingStore(PRICES_PATH)
+    cost_model = get_cost_model()
+    columns = synthetic_leaderboard(n, store, seed)
+    keys, efforts = columns["pricing_key"], columns["effort"]
+    score = CHART["score"]
+    state = {"df": pd.DataFrame(columns)}
+
+    def frontier():
+        return find_pareto_models(state["df"], score, equal_cost=CHART["equal_cost"])
+
+    def figure():
+        if "pareto_models" not in state:
+            state["pareto_models"] = frontier()
+        return build_figure(CHART, state["df"], state["pareto_models"])
+
+    def write_image():
+        if "fig" not in state:
+            state["fig"] = figure()
+        with tempfile.TemporaryDirectory() as tmp:
+            state["fig"].write_image(
+                Path(tmp) / "bench.png", width=WIDTH, height=HEIGHT
+            )
+
+    def lookups():
+        with warnings.catch_warnings():
+            # UNKNOWN_SHARE of the keys are unpriced on purpose
+            warnings.simplefilter("ignore", PricingWarning)
+            return [get_model_cost(key, state["pricing_data"]) for key in keys]
+
+    functions = {
+        "dataframe": lambda: pd.DataFrame(columns),
+        # What load_pricing_data does when the parsed store isn't cached yet
+        "pricing_load": lambda: PricingStore(PRICES_PATH).as_dict(),
+        "pricing_lookup": lookups,
+        "pricing_batch": lambda: cost_model.costs(keys, efforts, store),
+        "frontier": frontier,
+        "figure": figure,
+        "write_image": write_image,
+    }
+    outputs = {
+        "dataframe": "df",
+        "pricing_load": "pricing_data",
+        "frontier": "pareto_models",
+        "figure": "fig",
+    }
+    state["pricing_data"] = store.as_dict()
+
+    results = []
+    for stage in STAGES:
+        if stage not in stages:
+            continue
+        result = {"rows": n, "stage": stage}
+        try:
+            value, runs = measure(functions[stage], repeat)
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {' '.join(str(e).split())}"
+        else:
+            if stage in outputs:
+                state[outputs[stage]] = value
+            result.update(seconds=min(runs), runs=runs)
+        results.append(result)
+    return results
+
+
+def environment():
+    """Versions and machine details to store alongside the timings."""
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "engine": engine_hash(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "plotly": plotly.__version__,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Stages that got more than `tolerance` (a fraction) slower than `baseline`."""
+    before = {
+        (r["rows"], r["stage"]): r["seconds"]
+        for r in baseline["results"]
+        if "seconds" in r
+    }
+    regressions = []
+    for r in results:
+        old = before.get((r["rows"], r["stage"]))
+        if old is None or "seconds" not in r or r["seconds"] < MIN_SECONDS:
+            continue
+        if r["seconds"] > old * (1 + tolerance):
+            regressions.append(dict(r, baseline=old, ratio=r["seconds"] / old))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time the frontier, pricing and render pipeline on synthetic "
+        "leaderboards and print the results as JSON."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(SIZES),
+        help="Leaderboard sizes in rows (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGES,
+        default=list(STAGES),
+        help="Stages to time (default: all).",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per stage; the best is kept."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON here instead of stdout.")
+    parser.add_argument(
+        "--baseline",
+        help="Earlier results to compare against; exits with status 1 on regressions.",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Slowdown allowed against the baseline, as a fraction "
+        "(default: %(default)s).",
+    )
+    args = parser.parse_args()
+
+    results = []
+    for n in args.sizes:
+        for result in bench_size(n, args.stages, args.repeat, args.seed):
+            results.append(result)
+            timing = result.get("error") or f"{result['seconds']:.4f}s"
+            print(f"{n:>9} rows  {result['stage']:<15} {timing}", file=sys.stderr)
+
+    report = {"environment": environment(), "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for r in regressions:
+            print(
+                f"Regression: {r['stage']} at {r['rows']} rows took "
+                f"{r['seconds']:.4f}s, {r['ratio']:.2f}x the baseline",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import contextlib
+import os
+from pathlib import Path
+
+# Cache files are named <prefix><16 hex digits of a content hash><suffix>
+DIGEST_GLOB = "[0-9a-f]" * 16
+
+
+@contextlib.contextmanager
+def atomic_path(path):
+    """Yield a temporary path to write, then rename it over `path`.
+
+    Write then rename so a concurrent reader never sees a partial file. The
+    temporary file is removed if writing fails.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def prune_caches(directory, prefix, suffix, keep=0):
+    """Delete a cache's hash-named files but the `keep` most recently modified."""
+    caches = sorted(
+        Path(directory).glob(f"{prefix}{DIGEST_GLOB}{suffix}"),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for stale in caches[keep:]:
+        stale.unlink(missing_ok=True)
@@ -0,0 +1,689 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# pandas, plotly and kaleido are imported where they're used, so that
+# frontier-only queries don't pay for them at startup
+import profiling
+from frontier import domination_margins, find_pareto_models, pareto_frontier
+from labels import place_labels
+from leaderboards import DATA_DIR, load_leaderboard, read_columns
+from pricing import (
+    PRICING_MODES,
+    PricingError,
+    check_misses,
+    find_misses,
+    get_cost_model,
+    get_pricing_store,
+)
+from specs import CHARTS, CHARTS_BY_NAME, engine_hash
+from uncertainty import bootstrap_frontier
+
+# Default export size used by every chart script
+WIDTH = 1200
+HEIGHT = 800
+
+# Export sizes as (filename suffix, width, height)
+SIZES = [("", WIDTH, HEIGHT)]
+THUMBNAIL = ("-thumb", 300, 200)
+
+# Build manifest written next to the exported images
+MANIFEST_NAME = ".render-manifest.json"
+
+# Charts with more points than this switch to WebGL and thin out models far
+# below the frontier
+LARGE_DATA_POINTS = 10_000
+# Models trailing the frontier by more than this share of the score range are
+# binned on a (cost, score) grid of LOD_BINS cells, one model drawn per cell
+FAR_FROM_FRONTIER = 0.1
+LOD_BINS = (200, 100)
+
+# Values of PARETO_HEADLESS that turn headless mode on
+TRUTHY = ("1", "true", "yes", "on")
+
+
+def build_chart_data(chart, cost_model=None, df=None, store=None, pricing_mode=None):
+    """Load a chart's leaderboard, price it and find its frontier.
+
+    `df` and `store` replace the current leaderboard data and llm-prices.json,
+    for example with historical snapshots. Models with no price are handled
+    by `pricing_mode` (see `pricing.check_misses`); in lenient mode they are
+    dropped rather than priced at zero.
+
+    Returns (df, pareto_models) where df has model, score and cost columns.
+    """
+    with profiling.stage("load"):
+        df = load_leaderboard(chart["name"]) if df is None else df.copy()
+    if "pricing_key" in df:
+        with profiling.stage("pricing"):
+            if cost_model is None:
+                cost_model = get_cost_model(chart.get("effort_multipliers"))
+            df["cost"] = cost_model.costs(
+                df["pricing_key"], df["effort"], store, default=np.nan
+            )
+            unpriced = df["cost"].isna().to_numpy()
+            profiling.count("pricing_misses", int(unpriced.sum()))
+            if unpriced.any():
+                misses = find_misses(
+                    {
+                        chart["name"]: (
+                            df["model"][unpriced],
+                            df["pricing_key"][unpriced],
+                        )
+                    },
+                    store,
+                )
+                check_misses(misses, pricing_mode)
+                df = df[~unpriced].copy()
+    if chart.get("drop_unpriced"):
+        df = df[df["cost"].notna() & (df["cost"] > 0)].copy()
+
+    with profiling.stage("frontier"):
+        pareto_models = find_pareto_models(
+            df, chart["score"], equal_cost=chart["equal_cost"]
+        )
+    profiling.count("rows", len(df))
+    profiling.count("frontier_size", len(pareto_models))
+    return df, pareto_models
+
+
+def chart_arrays(chart, pricing_mode=None):
+    """Load and price a chart's leaderboard with NumPy only, without pandas.
+
+    Returns (models, cost, score): a list of model names and two arrays, with
+    the same rows and costs as `build_chart_data`.
+    """
+    columns = read_columns(chart["name"])
+
+    def floats(values):
+        return np.array([np.nan if v is None else float(v) for v in values])
+
+    models = columns["model"]
+    score = floats(columns[chart["score"]])
+    keep = np.ones(len(models), dtype=bool)
+    if "pricing_key" in columns:
+        cost_model = get_cost_model(chart.get("effort_multipliers"))
+        cost = cost_model.costs(
+            columns["pricing_key"], columns["effort"], default=np.nan
+        )
+        keep = ~np.isnan(cost)
+        profiling.count("pricing_misses", int((~keep).sum()))
+        if not keep.all():
+            rows = np.flatnonzero(~keep)
+            misses = find_misses(
+                {
+                    chart["name"]: (
+                        [models[i] for i in rows],
+                        [columns["pricing_key"][i] for i in rows],
+                    )
+                }
+            )
+            check_misses(misses, pricing_mode)
+    else:
+        cost = floats(columns["cost"])
+
+    if chart.get("drop_unpriced"):
+        keep &= ~np.isnan(cost) & (cost > 0)
+    if not keep.all():
+        rows = np.flatnonzero(keep)
+        models, cost, score = [models[i] for i in rows], cost[rows], score[rows]
+    return models, cost, score
+
+
+def pricing_misses(charts=CHARTS, store=None):
+    """Check every chart's leaderboard-to-pricing mapping in one batched lookup.
+
+    Reads the CSVs without pandas. Returns the misses of all charts priced
+    from llm-prices.json (see `pricing.find_misses`).
+    """
+    leaderboards = {}
+    for chart in charts:
+        columns = read_columns(chart["name"])
+        if "pricing_key" in columns:
+            leaderboards[chart["name"]] = (columns["model"], columns["pricing_key"])
+    return find_misses(leaderboards, store)
+
+
+def chart_frontier(chart, pricing_mode=None):
+    """Find a chart's frontier with NumPy only, for queries that don't plot.
+
+    Returns one {"model", "cost", "score"} dict per frontier model, ordered by
+    cost. Gives the same frontier as `build_chart_data` without pandas.
+    """
+    with profiling.stage("load"):
+        models, cost, score = chart_arrays(chart, pricing_mode)
+    with profiling.stage("frontier"):
+        frontier, _ = pareto_frontier(cost, score, chart["equal_cost"])
+    profiling.count("rows", len(models))
+    profiling.count("frontier_size", len(frontier))
+    return [
+        {"model": models[i], "cost": float(cost[i]), "score": float(score[i])}
+        for i in frontier
+    ]
+
+
+def level_of_detail(cost, score, on_frontier):
+    """Pick the rows to draw for a large leaderboard.
+
+    Frontier models and models close to it are all kept. Models trailing the
+    frontier by more than FAR_FROM_FRONTIER of the score range are binned on a
+    log-cost by score grid, and only the first model in each cell is kept.
+    Returns (rows, counts): the kept row positions, in order, and how many
+    models each kept row stands for.
+    """
+    cost = np.asarray(cost, dtype=float)
+    score = np.asarray(score, dtype=float)
+    score_gap, _ = domination_margins(cost, score)
+    span = (np.nanmax(score) - np.nanmin(score)) or 1.0
+    far = ~on_frontier & (score_gap > FAR_FROM_FRONTIER * span)
+    near_rows, far_rows = np.flatnonzero(~far), np.flatnonzero(far)
+
+    def cells(values, bins):
+        finite = np.isfinite(values)
+        if not finite.any():
+            return np.zeros(len(values), dtype=np.intp)
+        low, high = values[finite].min(), values[finite].max()
+        scaled = (values - low) / ((high - low) or 1.0) * (bins - 1)
+        # Non-finite values (free models on a log axis) share one extra cell
+        return np.where(finite, np.round(np.nan_to_num(scaled)), bins).astype(np.intp)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_cost = np.where(cost > 0, np.log10(cost), np.nan)
+    cost_bins, score_bins = LOD_BINS
+    cell = cells(log_cost[far_rows], cost_bins) * (score_bins + 1) + cells(
+        score[far_rows], score_bins
+    )
+    _, first, counts = np.unique(cell, return_index=True, return_counts=True)
+
+    rows = np.concatenate([near_rows, far_rows[first]])
+    counts = np.concatenate([np.ones(len(near_rows), dtype=np.intp), counts])
+    order = np.argsort(rows)
+    return rows[order], counts[order]
+
+
+def build_figure(chart, df, pareto_models, band=None, large=None):
+    """Plot the models and their Pareto frontier on a log-cost scatter chart.
+
+    `band` is a `bootstrap_frontier` result to shade around the frontier, and
+    a `frontier_probability` column in `df` is shown when hovering a model.
+    Charts with more than LARGE_DATA_POINTS models (or `large=True`) are drawn
+    with WebGL, label only frontier models, and bin the models far below the
+    frontier (see `level_of_detail`).
+    """
+    import plotly.graph_objects as go
+
+    score = chart["score"]
+    fig = go.Figure()
+    on_frontier = df["model"].isin(pareto_models).to_numpy()
+    hovertext = df["model"]
+    if "frontier_probability" in df:
+        hovertext = hovertext + df["frontier_probability"].map(
+            "<br>P(frontier) = {:.2f}".format
+        )
+
+    if large is None:
+        large = len(df) > LARGE_DATA_POINTS
+    scatter = go.Scattergl if large else go.Scatter
+    if large:
+        rows, counts = level_of_detail(df["cost"], df[score], on_frontier)
+        df, on_frontier = df.iloc[rows], on_frontier[rows]
+        hovertext = hovertext.iloc[rows] + np.where(
+            counts > 1, [f"<br>+{n - 1} more models nearby" for n in counts], ""
+        )
+
+    # Place labels so they don't overlap; hidden ones stay in the hover text
+    with profiling.stage("labels"):
+        texts, positions = place_labels(
+            df["cost"],
+            df[score],
+            df["model"],
+            on_frontier,
+            chart["text_size"],
+            labelled=on_frontier if large else None,
+        )
+
+    # Add all models
+    fig.add_trace(
+        scatter(
+            x=df["cost"],
+            y=df[score],
+            mode="markers+text",
+            marker=dict(
+                color="blue",
+                size=8,
+                symbol=np.where(on_frontier, "square", "circle").tolist(),
+                line=dict(
+                    color="black",
+                    width=np.where(on_frontier, 2, 0).tolist(),
+                ),
+            ),
+            text=texts,
+            textposition=positions,
+            textfont=dict(size=chart["text_size"]),
+            hovertext=hovertext,
+            hoverinfo="text",
+            name="Models",
+        )
+    )
+
+    if band is not None:
+        # Shade between the band's upper and lower quantiles
+        fig.add_trace(
+            go.Scatter(
+                x=band["grid"],
+                y=band["upper"],
+                mode="lines",
+                line=dict(width=0),
+                hoverinfo="skip",
+                showlegend=False,
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=band["grid"],
+                y=band["lower"],
+                mode="lines",
+                line=dict(width=0),
+                fill="tonexty",
+                fillcolor="rgba(0, 0, 0, 0.15)",
+                hoverinfo="skip",
+                name=f"Frontier {band['level']:.0%} Band",
+            )
+        )
+
+    # Connect Pareto frontier points
+    pareto_df = df[on_frontier].sort_values("cost")
+    fig.add_trace(
+        go.Scatter(
+            x=pareto_df["cost"],
+            y=pareto_df[score],
+            mode="lines",
+            line=dict(color="black", width=2, dash="dash"),
+            name="Pareto Frontier",
+        )
+    )
+
+    fig.update_layout(
+        title=chart["title"],
+        xaxis_title=chart["xaxis_title"],
+        yaxis_title=chart["yaxis_title"],
+        xaxis_type="log",
+        showlegend=True,
+        legend=dict(
+            itemsizing="constant",
+        ),
+    )
+    return fig
+
+
+def load_figure(chart):
+    """Build a chart's figure from its spec."""
+    df, pareto_models = build_chart_data(chart)
+    with profiling.stage("figure"):
+        return build_figure(chart, df, pareto_models)
+
+
+def chart_fingerprint(chart, sizes=SIZES):
+    """Hash every input a chart's images depend on.
+
+    Covers the spec, export sizes, leaderboard CSV, the llm-prices.json entries
+    of the models it references, the cost model and the engine source, so a
+    price change only invalidates the charts that price that model.
+    """
+    raw = (DATA_DIR / f"{chart['name']}.csv").read_bytes()
+    inputs = {
+        "spec": chart,
+        "sizes": sizes,
+        "data": hashlib.sha256(raw).hexdigest(),
+        "engine": engine_hash(),
+    }
+    df = load_leaderboard(chart["name"])
+    if "pricing_key" in df:
+        store = get_pricing_store()
+        inputs["prices"] = {
+            key: store.tier_entries(key) for key in sorted(set(df["pricing_key"]))
+        }
+        inputs["cost_model"] = get_cost_model(
+            chart.get("effort_multipliers")
+        ).describe()
+    encoded = json.dumps(inputs, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_manifest(output_dir):
+    """Read the build manifest of an output directory (empty if there is none)."""
+    path = Path(output_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_manifest(output_dir, manifest):
+    """Write the build manifest of an output directory."""
+    path = Path(output_dir) / MANIFEST_NAME
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def is_stale(chart, fingerprint, manifest, output_dir):
+    """Whether a chart's inputs changed or one of its images is missing."""
+    entry = manifest.get(chart["name"])
+    return (
+        entry is None
+        or entry["fingerprint"] != fingerprint
+        or not all((Path(output_dir) / name).exists() for name in entry["outputs"])
+    )
+
+
+def output_targets(chart, output_dir, sizes):
+    """Return (path, width, height) for every requested size of a chart."""
+    path = Path(output_dir) / chart["output"]
+    return [
+        (path.with_name(path.stem + suffix + path.suffix), width, height)
+        for suffix, width, height in sizes
+    ]
+
+
+def failed_exports(targets, error):
+    """Results for [(path, size)] export targets that could not be exported."""
+    message = f"{type(error).__name__}: {error}"
+    return [
+        {"path": str(path), "build": 0.0, "export": 0.0, "error": message}
+        for path, _ in targets
+    ]
+
+
+def export_batch(groups, profile=False):
+    """Export one worker's share of `export_figures` through one kaleido session.
+
+    `groups` pairs each figure with its [(path, (width, height))] targets, and
+    a figure that fails fails all of its targets. Returns the results of each
+    group's targets.
+    """
+    import asyncio
+
+    import kaleido
+    import plotly.io as pio
+
+    async def export():
+        results = []
+        async with kaleido.Kaleido() as k:
+            for figure, targets in groups:
+                if profile:
+                    chart = figure.get("name") if isinstance(figure, dict) else None
+                    profiling.start(chart or Path(targets[0][0]).stem)
+                try:
+                    start = time.perf_counter()
+                    if isinstance(figure, dict):
+                        figure = load_figure(figure)
+                    elif isinstance(figure, str):
+                        figure = pio.from_json(figure)
+                    build = time.perf_counter() - start
+
+                    group = []
+                    for path, (width, height) in targets:
+                        start = time.perf_counter()
+                        with profiling.stage("export"):
+                            errors = await k.write_fig(
+                                figure,
+                                path=path,
+                                opts={"width": width, "height": height},
+                            )
+                        # kaleido returns export errors instead of raising them
+                        if errors:
+                            raise errors[0]
+                        group.append(
+                            {
+                                "path": str(path),
+                                "build": build,
+                                "export": time.perf_counter() - start,
+                                "error": None,
+                            }
+                        )
+                        build = 0.0
+                except Exception as e:
+                    group = failed_exports(targets, e)
+                if profile:
+                    group[0]["profile"] = profiling.stop()
+                results.append(group)
+        return results
+
+    try:
+        return asyncio.run(export())
+    except Exception as e:
+        # kaleido itself failed to start, so nothing in the batch was exported
+        return [failed_exports(targets, e) for _, targets in groups]
+
+
+def export_figures(jobs, workers=None, profile=False):
+    """Export (figure, path, (width, height)) jobs through kaleido.
+
+    A figure is a plotly figure, its JSON, or a chart spec, which is built
+    with `load_figure` in the worker that exports it. Consecutive jobs sharing
+    a figure object build it once. Figures are split across a process pool
+    sized to the available cores (or `workers`), and each worker exports
+    through a single kaleido session. A failure is reported in its job's
+    result instead of stopping the others.
+
+    Returns one dict per job, in order, with its "path", "build" and "export"
+    seconds and "error" (None on success). With `profile`, the first job of
+    each figure also has the profiling report of building and exporting it
+    under "profile".
+    """
+    groups = []
+    for figure, path, size in jobs:
+        if groups and groups[-1][0] is figure:
+            groups[-1][1].append((path, size))
+        else:
+            groups.append((figure, [(path, size)]))
+    if not groups:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(groups))
+    if workers == 1:
+        exported = export_batch(groups, profile)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        exported = [None] * len(groups)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (pool.submit(export_batch, groups[i::workers], profile), i)
+                for i in range(workers)
+            ]
+            for future, i in futures:
+                try:
+                    exported[i::workers] = future.result()
+                except Exception as e:
+                    # The worker died, so every job in its batch failed
+                    exported[i::workers] = [
+                        failed_exports(targets, e) for _, targets in groups[i::workers]
+                    ]
+    return [result for group in exported for result in group]
+
+
+def render_charts(charts, output_dir=".", sizes=SIZES, jobs=None, profile=False):
+    """Render charts concurrently, one kaleido session per worker process.
+
+    Each chart is built in the worker that exports it (see `export_figures`).
+    Returns one result dict per chart, in input order, with its outputs,
+    build and export seconds, and with `profile` its profiling report under
+    "profile".
+    """
+    targets = [output_targets(chart, output_dir, sizes) for chart in charts]
+    exports = iter(
+        export_figures(
+            [
+                (chart, path, (width, height))
+                for chart, paths in zip(charts, targets)
+                for path, width, height in paths
+            ],
+            jobs,
+            profile,
+        )
+    )
+    results = []
+    for chart, paths in zip(charts, targets):
+        group = [next(exports) for _ in paths]
+        result = {
+            "name": chart["name"],
+            "outputs": [job["path"] for job in group],
+            "build": sum(job["build"] for job in group),
+            "export": sum(job["export"] for job in group),
+            "error": next((job["error"] for job in group if job["error"]), None),
+        }
+        if result["error"]:
+            result["outputs"] = []
+        if group and "profile" in group[0]:
+            result["profile"] = group[0]["profile"]
+        results.append(result)
+    return results
+
+
+def parse_output_args(argv=None):
+    """Parse the output options shared by every chart script."""
+    parser = argparse.ArgumentParser(description="Build and export a Pareto chart.")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        default=os.environ.get("PARETO_HEADLESS", "").lower() in TRUTHY,
+        help="Skip fig.show() and only export (or set PARETO_HEADLESS=1).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("png", "html"),
+        default=os.environ.get("PARETO_FORMAT", "png"),
+        help="Export a PNG image or a standalone HTML file (or set PARETO_FORMAT).",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=0,
+        metavar="DRAWS",
+        help="Resample scores this many times (for example 10000) to shade a "
+        "confidence band around the frontier.",
+    )
+    parser.add_argument(
+        "--score-sd",
+        type=float,
+        default=None,
+        help="Standard deviation of the score noise (default: 2%% of the "
+        "leaderboard's score range).",
+    )
+    parser.add_argument(
+        "--price-sd",
+        type=float,
+        default=0.0,
+        help="Relative (log-normal) price noise (default: 0).",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed.")
+    parser.add_argument(
+        "--frontier-only",
+        action="store_true",
+        help="Print the frontier models and exit, without plotting or exporting.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print --frontier-only output as JSON."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=os.environ.get("PARETO_PROFILE", "").lower() in TRUTHY,
+        help="Print the time and peak memory of each pipeline stage (or set "
+        "PARETO_PROFILE=1).",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Also write the profile as a Chrome trace JSON file (implies --profile).",
+    )
+    parser.add_argument(
+        "--pricing",
+        choices=PRICING_MODES,
+        default=None,
+        help="Leave models with no price out of the chart with a warning "
+        "(lenient, the default), or stop with a report of them (strict). "
+        "Or set PARETO_PRICING.",
+    )
+    args = parser.parse_args(argv)
+    args.profile = args.profile or bool(args.trace)
+    return args
+
+
+def run_chart(name):
+    """Build a chart from its spec, then show and export it."""
+    chart = CHARTS_BY_NAME[name]
+    args = parse_output_args()
+    if args.profile:
+        profiling.start(name)
+    try:
+        build_and_export(chart, args)
+    except PricingError as e:
+        sys.exit(str(e))
+    finally:
+        if args.profile:
+            report = profiling.stop()
+            print(profiling.format_report(report), file=sys.stderr)
+            if args.trace:
+                profiling.write_trace([report], args.trace)
+
+
+def build_and_export(chart, args):
+    """Run a chart's pipeline for the parsed output options."""
+    name = chart["name"]
+    if args.frontier_only:
+        frontier = chart_frontier(chart, args.pricing)
+        if args.json:
+            print(json.dumps({"chart": name, "frontier": frontier}, indent=2))
+        else:
+            for row in frontier:
+                print(f"{row['model']:<40} {row['cost']:>10.2f} {row['score']:>10g}")
+        return
+
+    with profiling.stage("import"):
+        import pandas  # noqa: F401
+        import plotly.graph_objects  # noqa: F401
+    df, pareto_models = build_chart_data(chart, pricing_mode=args.pricing)
+    band = None
+    if args.bootstrap:
+        with profiling.stage("bootstrap"):
+            band = bootstrap_frontier(
+                df["cost"],
+                df[chart["score"]],
+                args.score_sd,
+                args.price_sd,
+                args.bootstrap,
+                chart["equal_cost"],
+                rng=args.seed,
+            )
+        df = df.assign(frontier_probability=band["probability"])
+        ranked = df[df["frontier_probability"] > 0].sort_values(
+            "frontier_probability", ascending=False
+        )
+        print(
+            ranked[["model", "cost", chart["score"], "frontier_probability"]]
+            .rename(columns={"frontier_probability": "P(frontier)"})
+            .to_string(index=False)
+        )
+    with profiling.stage("figure"):
+        fig = build_figure(chart, df, pareto_models, band)
+    show_and_export(fig, chart["output"], args=args)
+
+
+def show_and_export(fig, output, width=WIDTH, height=HEIGHT, args=None):
+    """Show `fig` unless running headless, then export it as PNG or HTML."""
+    args = args or parse_output_args()
+    if not args.headless:
+        with profiling.stage("show"):
+            fig.show()
+    with profiling.stage("export"):
+        if args.format == "html":
+            fig.write_html(Path(output).with_suffix(".html"))
+        else:
+            fig.write_image(output, width=width, height=height)
@@ -0,0 +1,173 @@
+import argparse
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+
+from charts import CHARTS
+from frontier import pareto_frontier
+from leaderboards import load_leaderboard, read_columns
+from pricing import get_cost_model, get_pricing_store, normalize_name
+
+NORMALIZATIONS = ("zscore", "percentile")
+
+
+def join_key(store, name, effort=None):
+    """Key that identifies the same model (and effort) across leaderboards.
+
+    Names are resolved to their llm-prices.json name where possible, so
+    "o3-2025-04-16" on LM Arena and "o3 (high)" on SimpleBench both become "o3"
+    through their pricing keys.
+    """
+    key = normalize_name(store.canonical_name(name) or name)
+    return key if effort is None else f"{key} ({effort})"
+
+
+def self_priced(charts=CHARTS):
+    """Names of the leaderboards that report their own costs instead of pricing keys."""
+    return [
+        chart["name"]
+        for chart in charts
+        if "pricing_key" not in read_columns(chart["name"])
+    ]
+
+
+def load_scores(charts=CHARTS, store=None):
+    """Stack every leaderboard into one long table of (leaderboard, key, score) rows.
+
+    Rows are joined on their pricing key and effort. Leaderboards that report
+    their own costs (see `self_priced`) are left out: their model names carry
+    no effort and rarely match an llm-prices.json name, so joining them by
+    name drops most rows and prices the rest as the wrong run.
+    """
+    store = store or get_pricing_store()
+    frames = []
+    for chart in charts:
+        df = load_leaderboard(chart["name"])
+        if "pricing_key" not in df:
+            continue
+        names, efforts = df["pricing_key"], df["effort"]
+        frames.append(
+            pd.DataFrame(
+                {
+                    "leaderboard": chart["name"],
+                    "key": [join_key(store, n, e) for n, e in zip(names, efforts)],
+                    "pricing_key": [store.canonical_name(n) for n in names],
+                    "effort": list(efforts),
+                    "score": df[chart["score"]].to_numpy(dtype=float),
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def normalize_scores(scores, method="zscore"):
+    """Put each leaderboard's scores on a common scale.
+
+    "zscore" centers and scales each leaderboard to mean 0 and standard
+    deviation 1; "percentile" replaces scores with their rank percentile.
+    """
+    by_leaderboard = scores.groupby("leaderboard")["score"]
+    if method == "zscore":
+        mean = by_leaderboard.transform("mean")
+        std = by_leaderboard.transform("std", ddof=0)
+        return (scores["score"] - mean) / std.where(std > 0, 1.0)
+    if method == "percentile":
+        return by_leaderboard.rank(pct=True)
+    raise ValueError(f"Unknown normalization: {method!r}")
+
+
+def combined_frontier(
+    charts=CHARTS, method="zscore", min_coverage=2, cost_model=None, store=None
+):
+    """Merge every leaderboard and find the frontier of cost vs aggregate score.
+
+    Each model's aggregate score is the mean of its normalized scores over the
+    leaderboards it appears on (the best variant per leaderboard), and only
+    models on at least `min_coverage` leaderboards are kept. Costs come from
+    llm-prices.json, since self-reported leaderboard costs aren't comparable,
+    so models without a price are dropped.
+
+    Returns a DataFrame with one row per model: key, cost, aggregate score,
+    coverage, a normalized score column per leaderboard and `on_frontier`.
+    """
+    store = store or get_pricing_store()
+    cost_model = cost_model or get_cost_model()
+    scores = load_scores(charts, store)
+    scores["normalized"] = normalize_scores(scores, method)
+
+    table = scores.pivot_table(
+        index="key", columns="leaderboard", values="normalized", aggfunc="max"
+    )
+    table = table.reindex(columns=[c["name"] for c in charts if c["name"] in table])
+    identity = scores.groupby("key").agg(
+        pricing_key=("pricing_key", "first"), effort=("effort", "first")
+    )
+
+    merged = identity.join(table).reset_index()
+    merged["coverage"] = table.notna().sum(axis=1).to_numpy()
+    merged["aggregate"] = np.nanmean(table.to_numpy(), axis=1)
+    merged["cost"] = cost_model.costs(
+        merged["pricing_key"].where(merged["pricing_key"].notna(), ""),
+        merged["effort"],
+        store,
+        default=np.nan,
+    )
+    merged = merged[(merged["coverage"] >= min_coverage) & merged["cost"].notna()]
+    merged = merged.reset_index(drop=True)
+
+    frontier, _ = pareto_frontier(
+        merged["cost"].to_numpy(), merged["aggregate"].to_numpy(), "best"
+    )
+    merged["on_frontier"] = False
+    merged.loc[frontier, "on_frontier"] = True
+    return merged.sort_values("cost", ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find the models that are cost-efficient across every "
+        "leaderboard at once."
+    )
+    parser.add_argument(
+        "--normalize",
+        choices=NORMALIZATIONS,
+        default="zscore",
+        help="How scores are put on a common scale (default: zscore).",
+    )
+    parser.add_argument(
+        "--min-coverage",
+        type=int,
+        default=2,
+        help="Only rank models on at least this many leaderboards (default: 2).",
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="Print every model, not just the frontier."
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON output.")
+    args = parser.parse_args()
+
+    skipped = self_priced()
+    if skipped:
+        print(
+            f"Left out (they report their own costs): {', '.join(skipped)}",
+            file=sys.stderr,
+        )
+    merged = combined_frontier(method=args.normalize, min_coverage=args.min_coverage)
+    if not args.all:
+        merged = merged[merged["on_frontier"]]
+
+    if args.json:
+        print(json.dumps(json.loads(merged.to_json(orient="records")), indent=2))
+        return
+
+    print(
+        merged[["key", "cost", "aggregate", "coverage", "on_frontier"]].to_string(
+            index=False, float_format=lambda v: f"{v:.2f}"
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import html
+from pathlib import Path
+
+from charts import CHARTS, HEIGHT, WIDTH, load_figure
+
+DASHBOARD_NAME = "index.html"
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Pareto Frontier LLMs</title>
+<style>
+body {{ font-family: sans-serif; margin: 0 auto; max-width: {width}px; }}
+nav a {{ margin-right: 1em; }}
+.chart {{ width: {width}px; height: {height}px; }}
+</style>
+<script>{plotlyjs}</script>
+</head>
+<body>
+<h1>Pareto Frontier LLMs</h1>
+<nav>{nav}</nav>
+{sections}
+<script>
+// Parse and plot each chart's data only once it scrolls into view
+function plot(div) {{
+  var fig = JSON.parse(document.getElementById(div.id + "-data").textContent);
+  Plotly.newPlot(div, fig.data, fig.layout, {{responsive: true}});
+}}
+var charts = document.querySelectorAll(".chart");
+if ("IntersectionObserver" in window) {{
+  var observer = new IntersectionObserver(function (entries) {{
+    entries.forEach(function (entry) {{
+      if (entry.isIntersecting) {{
+        observer.unobserve(entry.target);
+        plot(entry.target);
+      }}
+    }});
+  }}, {{rootMargin: "200px"}});
+  charts.forEach(function (div) {{ observer.observe(div); }});
+}} else {{
+  charts.forEach(plot);
+}}
+</script>
+</body>
+</html>
+"""
+
+SECTION = """<section id="{name}">
+<h2>{title}</h2>
+<div class="chart" id="chart-{name}"></div>
+<script type="application/json" id="chart-{name}-data">{data}</script>
+</section>"""
+
+
+def build_dashboard(charts=CHARTS):
+    """Render charts into one self-contained HTML page.
+
+    plotly.js is inlined once for the whole page, and each chart's figure is
+    embedded as inert JSON that is only parsed and plotted when it scrolls
+    into view. No kaleido or browser is needed to write it.
+    """
+    from plotly.offline import get_plotlyjs
+
+    sections = []
+    for chart in charts:
+        # "</" would end the script tag early
+        data = load_figure(chart).to_json().replace("</", "<\\/")
+        sections.append(
+            SECTION.format(
+                name=chart["name"], title=html.escape(chart["title"]), data=data
+            )
+        )
+    nav = " ".join(
+        f'<a href="#{chart["name"]}">{html.escape(chart["title"])}</a>'
+        for chart in charts
+    )
+    return PAGE.format(
+        width=WIDTH,
+        height=HEIGHT,
+        plotlyjs=get_plotlyjs(),
+        nav=nav,
+        sections="\n".join(sections),
+    )
+
+
+def write_dashboard(charts=CHARTS, output_dir="."):
+    """Write the dashboard to <output_dir>/index.html and return its path."""
+    path = Path(output_dir) / DASHBOARD_NAME
+    path.write_text(build_dashboard(charts), encoding="utf-8")
+    return path
@@ -0,0 +1,264 @@
+import numpy as np
+
+# How points with the same cost are compared:
+# - "keep": equal-cost points never dominate each other (Aider, LiveBench, Scale)
+# - "best": a higher score at the same cost dominates (Artificial Analysis,
+#   LM Arena, SimpleBench)
+# - "first": only the first best-scoring model at each cost survives (Kagi)
+EQUAL_COST_RULES = ("keep", "best", "first")
+
+
+def _sweep(cost, score, equal_cost):
+    """Run the frontier sweep over each row of two (rows, n) arrays.
+
+    Returns (order, dominator): the sort order of every row, and for each
+    sorted position the sorted position of a point dominating it, or -1.
+    """
+    if equal_cost not in EQUAL_COST_RULES:
+        raise ValueError(f"Unknown equal_cost rule: {equal_cost!r}")
+
+    rows, n = cost.shape
+
+    # Sort by cost, best score first within a cost (stable, so ties keep input order)
+    order = np.argsort(-score, axis=1, kind="stable")
+    order = np.take_along_axis(
+        order,
+        np.argsort(np.take_along_axis(cost, order, 1), axis=1, kind="stable"),
+        1,
+    )
+    sorted_cost = np.take_along_axis(cost, order, 1)
+    sorted_score = np.take_along_axis(score, order, 1)
+    positions = np.broadcast_to(np.arange(n), (rows, n))
+
+    # Position where each run of equal costs starts
+    new_cost = np.ones((rows, n), dtype=bool)
+    new_cost[:, 1:] = sorted_cost[:, 1:] != sorted_cost[:, :-1]
+    group_start = np.maximum.accumulate(np.where(new_cost, positions, 0), axis=1)
+
+    # Position of the cheapest point holding the running best score
+    running_best = np.maximum.accumulate(sorted_score, axis=1)
+    new_best = np.ones((rows, n), dtype=bool)
+    new_best[:, 1:] = sorted_score[:, 1:] > running_best[:, :-1]
+    best_at = np.maximum.accumulate(np.where(new_best, positions, 0), axis=1)
+
+    # Best strictly cheaper point for every point
+    cheaper = np.take_along_axis(best_at, np.maximum(group_start - 1, 0), 1)
+    by_cheaper = (group_start > 0) & (
+        np.take_along_axis(sorted_score, cheaper, 1) >= sorted_score
+    )
+    dominator = np.where(by_cheaper, cheaper, -1)
+
+    if equal_cost == "best":
+        group_best = np.take_along_axis(sorted_score, group_start, 1)
+        by_equal = ~by_cheaper & (sorted_score < group_best)
+    elif equal_cost == "first":
+        by_equal = ~by_cheaper & (positions != group_start)
+    else:
+        by_equal = np.zeros((rows, n), dtype=bool)
+    dominator = np.where(by_equal, group_start, dominator)
+
+    return order, dominator
+
+
+def pareto_frontier(cost, score, equal_cost="keep"):
+    """Find the cost/score Pareto frontier with one sort and a running-max sweep.
+
+    A point is dominated when a strictly cheaper point scores at least as well;
+    `equal_cost` picks the tie rule between points with the same cost.
+
+    Returns (frontier, dominated_by): the positions of the frontier points in
+    order of increasing cost, and for every point the position of a point that
+    dominates it (-1 for frontier points).
+    """
+    cost = np.asarray(cost, dtype=float)
+    score = np.asarray(score, dtype=float)
+    if len(cost) == 0:
+        if equal_cost not in EQUAL_COST_RULES:
+            raise ValueError(f"Unknown equal_cost rule: {equal_cost!r}")
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    order, dominator = _sweep(cost[None, :], score[None, :], equal_cost)
+    order, dominator = order[0], dominator[0]
+
+    # Map sorted positions back to input positions
+    dominated_by = np.full(len(cost), -1, dtype=np.intp)
+    is_dominated = dominator >= 0
+    dominated_by[order[is_dominated]] = order[dominator[is_dominated]]
+
+    return order[~is_dominated], dominated_by
+
+
+def pareto_frontier_batch(cost, score, equal_cost="keep"):
+    """Compute frontier membership for many cost/score scenarios at once.
+
+    `cost` and `score` are (scenarios, n) arrays, or (n,) arrays shared by
+    every scenario. Returns a boolean (scenarios, n) array that is True where a
+    point is on that scenario's frontier.
+    """
+    cost, score = np.broadcast_arrays(
+        np.atleast_2d(np.asarray(cost, dtype=float)),
+        np.atleast_2d(np.asarray(score, dtype=float)),
+    )
+    on_frontier = np.zeros(cost.shape, dtype=bool)
+    if cost.shape[1] == 0:
+        return on_frontier
+
+    order, dominator = _sweep(cost, score, equal_cost)
+    np.put_along_axis(on_frontier, order, dominator < 0, axis=1)
+    return on_frontier
+
+
+def domination_margins(cost, score):
+    """How far each point is from the frontier, in score and in cost.
+
+    Returns (score_gap, cost_ratio): how many points a model trails the best
+    score available at its cost or less, and its cost divided by the cheapest
+    cost of any model scoring at least as well. Frontier points have a gap of 0
+    and a ratio of 1, unless the "keep" tie rule kept them next to a better
+    model of the same cost.
+    """
+    cost = np.asarray(cost, dtype=float)
+    score = np.asarray(score, dtype=float)
+    if len(cost) == 0:
+        return np.empty(0), np.empty(0)
+
+    # Best score at or below each cost
+    by_cost = np.argsort(cost, kind="stable")
+    best = np.maximum.accumulate(score[by_cost])
+    at_cost = np.searchsorted(cost[by_cost], cost, side="right") - 1
+    score_gap = np.maximum(best[at_cost] - score, 0.0)
+
+    # Cheapest cost at or above each score
+    by_score = np.argsort(-score, kind="stable")
+    cheapest = np.minimum.accumulate(cost[by_score])
+    at_score = np.searchsorted(-score[by_score], -score, side="right") - 1
+    cheapest = cheapest[at_score]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cost_ratio = np.where(
+            cheapest > 0, cost / cheapest, np.where(cost > 0, np.inf, 1.0)
+        )
+    return score_gap, cost_ratio
+
+
+def find_pareto_models(df, score_column, cost_column="cost", equal_cost="keep"):
+    """Return the models in `df` on the Pareto frontier, ordered by cost."""
+    frontier, _ = pareto_frontier(
+        df[cost_column].to_numpy(), df[score_column].to_numpy(), equal_cost
+    )
+    return df["model"].iloc[frontier].tolist()
+
+
+def _dominated_by_any(layer, point):
+    """Whether any row of `layer` dominates `point` (all objectives minimized)."""
+    return bool(np.any(np.all(layer <= point, axis=1) & np.any(layer < point, axis=1)))
+
+
+def _first_free_layer(is_dominated, layer_count):
+    """Binary search for the first layer that does not dominate a point."""
+    low, high = 0, layer_count
+    while low < high:
+        mid = (low + high) // 2
+        if is_dominated(mid):
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+def _layers_2d(points, order, ranks):
+    """Two objectives: a layer dominates a point iff its last point does.
+
+    Within a layer, lexicographic order makes the second objective strictly
+    decrease, so the last point added holds the layer's best second objective.
+    """
+    last = []
+    for i in order:
+        x, y = points[i]
+
+        def is_dominated(layer):
+            last_x, last_y = last[layer]
+            return last_y < y or (last_y == y and last_x < x)
+
+        layer = _first_free_layer(is_dominated, len(last))
+        if layer == len(last):
+            last.append(None)
+        last[layer] = (x, y)
+        ranks[i] = layer + 1
+
+
+def _layers_kd(points, order, ranks):
+    """Any number of objectives: check each candidate layer in one vector op."""
+    k = points.shape[1]
+    buffers, sizes = [], []
+    for i in order:
+        point = points[i]
+        layer = _first_free_layer(
+            lambda layer: _dominated_by_any(buffers[layer][: sizes[layer]], point),
+            len(buffers),
+        )
+        if layer == len(buffers):
+            buffers.append(np.empty((16, k)))
+            sizes.append(0)
+        elif sizes[layer] == len(buffers[layer]):
+            buffers[layer] = np.concatenate(
+                [buffers[layer], np.empty_like(buffers[layer])]
+            )
+        buffers[layer][sizes[layer]] = point
+        sizes[layer] += 1
+        ranks[i] = layer + 1
+
+
+def nondominated_layers(objectives, maximize=None):
+    """Rank points into non-dominated layers over any number of objectives.
+
+    `objectives` is an (n, k) array, minimized column by column unless the
+    matching entry of `maximize` is True. A point is dominated when another is
+    at least as good on every objective and strictly better on one. Layer 1 is
+    the Pareto frontier, layer 2 the frontier once layer 1 is removed, and so on.
+
+    Points are sorted lexicographically so every dominator comes before the
+    points it dominates, then each point goes to the first layer with no point
+    dominating it. Layers are found by binary search: if layer i dominates a
+    point, so does every earlier layer. Returns a 1-based layer per point.
+    """
+    points = np.asarray(objectives, dtype=float)
+    if points.ndim != 2:
+        raise ValueError("objectives must be an (n, k) array")
+    n, k = points.shape
+    if maximize is not None:
+        maximize = np.broadcast_to(np.asarray(maximize, dtype=bool), (k,))
+        points = np.where(maximize, -points, points)
+
+    ranks = np.zeros(n, dtype=np.intp)
+    if n == 0:
+        return ranks
+
+    # np.lexsort sorts by the last key first, so reverse the columns
+    order = np.lexsort(points.T[::-1])
+    if k == 1:
+        # Equal values share a layer; each larger value starts the next one
+        sorted_values = points[order, 0]
+        ranks[order] = np.cumsum(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    elif k == 2:
+        _layers_2d(points, order, ranks)
+    else:
+        _layers_kd(points, order, ranks)
+    return ranks
+
+
+def find_pareto_layers(df, minimize=("cost",), maximize=()):
+    """Rank the models in `df` into Pareto layers over several columns.
+
+    For example `find_pareto_layers(df, ["cost", "latency"], ["score",
+    "context_length"])`. With just cost and a score, layer 1 is the frontier
+    that `find_pareto_models` finds with `equal_cost="best"`. Returns a Series
+    of 1-based layers aligned with `df`.
+    """
+    import pandas as pd
+
+    columns = list(minimize) + list(maximize)
+    ranks = nondominated_layers(
+        df[columns].to_numpy(dtype=float),
+        [False] * len(minimize) + [True] * len(maximize),
+    )
+    return pd.Series(ranks, index=df.index, name="pareto_layer")
@@ -0,0 +1,254 @@
+import argparse
+import bisect
+import datetime
+import hashlib
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from cache import atomic_path
+from charts import CHARTS, CHARTS_BY_NAME, build_chart_data
+from leaderboards import DATA_DIR, load_leaderboard
+from pricing import PRICES_PATH, get_pricing_store
+
+HISTORY_DIR = DATA_DIR / "history"
+INDEX_NAME = "index.json"
+PRICES_SERIES = "prices"
+
+
+def score_series(name):
+    """Series name of a leaderboard's score snapshots."""
+    return f"scores/{name}"
+
+
+class HistoryStore:
+    """Append-only store of dated price and score snapshots.
+
+    Each series ("prices", or "scores/<leaderboard>") is a directory of
+    snapshot files named by date. index.json keeps every series' dates sorted,
+    so an as-of lookup is a binary search instead of a directory scan.
+    Snapshots are only ever appended after the newest one, so earlier as-of
+    lookups never change, and a snapshot identical to the newest one is not
+    stored again.
+    """
+
+    def __init__(self, root=HISTORY_DIR):
+        self.root = Path(root)
+        self.index_path = self.root / INDEX_NAME
+        self.index = {}
+        if self.index_path.exists():
+            with open(self.index_path, "r") as f:
+                self.index = json.load(f)
+
+    def dates(self, series):
+        """Sorted snapshot dates of a series."""
+        return [date for date, _, _ in self.index.get(series, [])]
+
+    def record(self, series, source, date):
+        """Snapshot the file `source` into `series` as of `date` (YYYY-MM-DD).
+
+        Returns the snapshot path, or None if the content matches the newest
+        snapshot. Raises ValueError when `date` already holds different content
+        or is before the newest snapshot, since that would change what earlier
+        as-of lookups return.
+        """
+        date = datetime.date.fromisoformat(str(date)).isoformat()
+        source = Path(source)
+        digest = hashlib.sha256(source.read_bytes()).hexdigest()
+        snapshots = self.index.setdefault(series, [])
+        if snapshots and snapshots[-1][2] == digest:
+            return None
+        newest = snapshots[-1][0] if snapshots else None
+        if newest == date:
+            raise ValueError(f"{series} already has a different snapshot on {date}")
+        if newest is not None and date < newest:
+            raise ValueError(
+                f"{series} snapshot dated {date} would land before the newest "
+                f"one ({newest}); snapshots are append-only"
+            )
+
+        relative = f"{series}/{date}{source.suffix}"
+        target = self.root / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, target)
+        snapshots.append([date, relative, digest])
+        self.save()
+        return target
+
+    def record_current(self, date=None, data_dir=DATA_DIR, prices_path=PRICES_PATH):
+        """Snapshot llm-prices.json and every leaderboard CSV.
+
+        Prices are dated by their `last_updated` field unless `date` is given,
+        or today when that field isn't after the newest price snapshot (the
+        prices changed without it being bumped); scores are dated `date`, or
+        today. Every series is recorded even if another one fails.
+
+        Returns (recorded, errors): the snapshot path (or None) of each
+        recorded series, and the error message of each series that failed.
+        """
+        today = datetime.date.today().isoformat()
+        prices_date = date
+        if prices_date is None:
+            last_updated = get_pricing_store(prices_path).last_updated
+            dates = self.dates(PRICES_SERIES)
+            if last_updated and (not dates or last_updated > dates[-1]):
+                prices_date = last_updated
+            else:
+                prices_date = today
+        sources = {PRICES_SERIES: (prices_path, prices_date)}
+        for chart in CHARTS:
+            sources[score_series(chart["name"])] = (
+                Path(data_dir) / f"{chart['name']}.csv",
+                date or today,
+            )
+
+        recorded, errors = {}, {}
+        for series, (source, series_date) in sources.items():
+            try:
+                recorded[series] = self.record(series, source, series_date)
+            except ValueError as e:
+                errors[series] = str(e)
+        return recorded, errors
+
+    def save(self):
+        """Write the index."""
+        with atomic_path(self.index_path) as tmp, open(tmp, "w") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+
+    def as_of(self, series, date):
+        """Path of the latest snapshot of a series on or before `date`, or None."""
+        snapshots = self.index.get(series, [])
+        position = bisect.bisect_right(self.dates(series), str(date))
+        if position == 0:
+            return None
+        return self.root / snapshots[position - 1][1]
+
+    def pricing_store(self, date):
+        """The pricing store as of `date`."""
+        path = self.as_of(PRICES_SERIES, date)
+        if path is None:
+            raise LookupError(f"No price snapshot on or before {date}")
+        return get_pricing_store(path)
+
+    def leaderboard(self, name, date):
+        """A leaderboard's scores as of `date`."""
+        path = self.as_of(score_series(name), date)
+        if path is None:
+            raise LookupError(f"No {name} snapshot on or before {date}")
+        return load_leaderboard(path.stem, path.parent)
+
+    def chart_data(self, chart, date):
+        """Rebuild a chart's (df, pareto_models) from the snapshots as of `date`."""
+        df = self.leaderboard(chart["name"], date)
+        store = self.pricing_store(date) if "pricing_key" in df else None
+        return build_chart_data(chart, df=df, store=store)
+
+    def frontier_history(self, chart, dates):
+        """Frontier of a chart at each date, as a long DataFrame.
+
+        Dates resolving to the same price and score snapshots share one
+        frontier computation. Dates before the first snapshots are skipped.
+        """
+        frames = []
+        computed = {}
+        for date in dates:
+            key = (
+                self.as_of(score_series(chart["name"]), date),
+                self.as_of(PRICES_SERIES, date),
+            )
+            if key[0] is None:
+                continue
+            if key not in computed:
+                df, pareto_models = self.chart_data(chart, date)
+                frontier = df[df["model"].isin(pareto_models)]
+                computed[key] = frontier[["model", "cost", chart["score"]]]
+            frames.append(computed[key].assign(date=str(date)))
+        if not frames:
+            return pd.DataFrame(columns=["date", "model", "cost", chart["score"]])
+        history = pd.concat(frames, ignore_index=True)
+        return history[["date", "model", "cost", chart["score"]]]
+
+
+def month_ends(start, end):
+    """Last day of every month from `start` to `end`, as YYYY-MM-DD strings.
+
+    `start` and `end` themselves are included; the list is empty when `end`
+    is before `start`.
+    """
+    if pd.Timestamp(end) < pd.Timestamp(start):
+        return []
+    dates = pd.date_range(start, end, freq=pd.offsets.MonthEnd())
+    return [d.date().isoformat() for d in dates.union(pd.to_datetime([start, end]))]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record price and score snapshots, and rebuild frontiers "
+        "as of past dates."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser(
+        "record", help="Snapshot llm-prices.json and every leaderboard."
+    )
+    record.add_argument("--date", help="Snapshot date (default: today).")
+    frontier = commands.add_parser(
+        "frontier", help="Show how a chart's frontier moved month over month."
+    )
+    frontier.add_argument("charts", nargs="*", help="Chart names (default: all).")
+    frontier.add_argument("--start", help="First date (default: first snapshot).")
+    frontier.add_argument(
+        "--end", default=datetime.date.today().isoformat(), help="Last date."
+    )
+    frontier.add_argument("--json", action="store_true", help="Print JSON output.")
+    args = parser.parse_args()
+
+    history = HistoryStore()
+    if args.command == "record":
+        recorded, errors = history.record_current(args.date)
+        for series, path in recorded.items():
+            print(f"{series:<40} {path or 'unchanged'}")
+        if errors:
+            sys.exit("\n".join(errors.values()))
+        return
+
+    unknown = set(args.charts) - set(CHARTS_BY_NAME)
+    if unknown:
+        parser.error(f"unknown charts: {', '.join(sorted(unknown))}")
+    charts = [CHARTS_BY_NAME[name] for name in args.charts] or CHARTS
+    results = {}
+    for chart in charts:
+        dates = history.dates(score_series(chart["name"]))
+        if not dates:
+            continue
+        dates = month_ends(args.start or dates[0], args.end)
+        results[chart["name"]] = history.frontier_history(chart, dates)
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    name: json.loads(frame.to_json(orient="records"))
+                    for name, frame in results.items()
+                },
+                indent=2,
+            )
+        )
+        return
+
+    for name, frame in results.items():
+        print(f"\n{name}")
+        previous = set()
+        for date, models in frame.groupby("date", sort=True)["model"]:
+            current = set(models)
+            changes = [f"+{m}" for m in sorted(current - previous)] + [
+                f"-{m}" for m in sorted(previous - current)
+            ]
+            print(f"{date}  {', '.join(changes) if changes else 'unchanged'}")
+            previous = current
+
+
+if __name__ == "__main__":
+    main()
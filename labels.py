@@ -0,0 +1,169 @@
+import numpy as np
+
+# Approximate plot area of a WIDTH x HEIGHT chart once margins and the legend
+# are taken off, in pixels
+PLOT_WIDTH = 900
+PLOT_HEIGHT = 620
+MARKER_SIZE = 8
+# Gap between a marker and its label, in pixels
+LABEL_GAP = 2
+# Rough width of a character relative to the font size
+CHAR_WIDTH = 0.6
+
+# Plotly text positions to try, best first
+POSITIONS = (
+    "top center",
+    "bottom center",
+    "middle right",
+    "middle left",
+    "top right",
+    "top left",
+    "bottom right",
+    "bottom left",
+)
+
+
+class SpatialGrid:
+    """Uniform grid of axis-aligned boxes for fast overlap checks."""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.boxes = []
+
+    def cells_of(self, box):
+        x0, y0, x1, y1 = box
+        size = self.cell_size
+        for cx in range(int(x0 // size), int(x1 // size) + 1):
+            for cy in range(int(y0 // size), int(y1 // size) + 1):
+                yield cx, cy
+
+    def add(self, box):
+        index = len(self.boxes)
+        self.boxes.append(box)
+        for cell in self.cells_of(box):
+            self.cells.setdefault(cell, []).append(index)
+
+    def overlaps(self, box):
+        """Yield the index of every stored box that `box` overlaps."""
+        x0, y0, x1, y1 = box
+        seen = set()
+        for cell in self.cells_of(box):
+            for i in self.cells.get(cell, ()):
+                if i in seen:
+                    continue
+                seen.add(i)
+                bx0, by0, bx1, by1 = self.boxes[i]
+                if x0 < bx1 and bx0 < x1 and y0 < by1 and by0 < y1:
+                    yield i
+
+
+def label_box(x, y, width, height, position):
+    """Box (x0, y0, x1, y1) a label takes at a plotly text position, y pointing up."""
+    vertical, horizontal = position.split()
+    offset = MARKER_SIZE / 2 + LABEL_GAP
+    if horizontal == "center":
+        x0 = x - width / 2
+    elif horizontal == "right":
+        x0 = x + offset
+    else:
+        x0 = x - offset - width
+    if vertical == "top":
+        y0 = y + offset
+    elif vertical == "bottom":
+        y0 = y - offset - height
+    else:
+        y0 = y - height / 2
+    return x0, y0, x0 + width, y0 + height
+
+
+def inside(box, width=PLOT_WIDTH, height=PLOT_HEIGHT):
+    """Whether a box lies within the plot area (plotly clips text outside it)."""
+    x0, y0, x1, y1 = box
+    return x0 >= 0 and y0 >= 0 and x1 <= width and y1 <= height
+
+
+def to_pixels(cost, score, width=PLOT_WIDTH, height=PLOT_HEIGHT):
+    """Map costs (log scale) and scores to approximate plot pixels.
+
+    Points with a cost of zero or less can't be shown on a log axis and get NaN.
+    """
+    cost = np.asarray(cost, dtype=float)
+    score = np.asarray(score, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_cost = np.where(cost > 0, np.log10(cost), np.nan)
+
+    def scale(values, pixels):
+        finite = values[np.isfinite(values)]
+        if len(finite) == 0:
+            return np.full(len(values), np.nan)
+        low, high = finite.min(), finite.max()
+        span = (high - low) or 1.0
+        # Plotly pads the autorange by a few percent on each side
+        low, high = low - 0.05 * span, high + 0.05 * span
+        return (values - low) / (high - low) * pixels
+
+    return scale(log_cost, width), scale(score, height)
+
+
+def place_labels(cost, score, texts, on_frontier, text_size=10, labelled=None):
+    """Pick a text position for every label, hiding the ones that don't fit.
+
+    Labels are placed greedily in log-cost space: frontier models first, then
+    the rest by descending score, each at the first position in POSITIONS that
+    overlaps neither a marker nor a label already placed. Overlaps are found
+    through a uniform grid, so each check only looks at nearby boxes. Frontier
+    labels are always shown (at their least crowded position); other labels
+    with no free position are hidden and left to the hover text.
+
+    `labelled` limits labels to a mask of points; the others still keep
+    labels off their markers.
+
+    Returns (texts, positions): the label per point ("" where hidden) and its
+    plotly text position.
+    """
+    texts = [str(t) for t in texts]
+    on_frontier = np.asarray(on_frontier, dtype=bool)
+    x, y = to_pixels(cost, score)
+    heights = np.full(len(texts), text_size * 1.2)
+    widths = np.array([len(t) * text_size * CHAR_WIDTH for t in texts])
+
+    grid = SpatialGrid(cell_size=max(4 * text_size, 1))
+    visible = np.isfinite(x) & np.isfinite(y)
+    if labelled is None:
+        labelled = np.ones(len(texts), dtype=bool)
+    radius = MARKER_SIZE / 2
+    marker_box = {}
+    for i in np.flatnonzero(visible):
+        marker_box[i] = len(grid.boxes)
+        grid.add((x[i] - radius, y[i] - radius, x[i] + radius, y[i] + radius))
+
+    placed_texts = [""] * len(texts)
+    positions = [POSITIONS[0]] * len(texts)
+    order = np.lexsort((-np.nan_to_num(np.asarray(score, dtype=float)), ~on_frontier))
+    for i in order:
+        if not (visible[i] and labelled[i]):
+            continue
+        boxes = [
+            label_box(x[i], y[i], widths[i], heights[i], position)
+            for position in POSITIONS
+        ]
+
+        # A label's own marker doesn't count against it, leaving the plot does
+        def clashes(box):
+            others = (j for j in grid.overlaps(box) if j != marker_box[i])
+            return (not inside(box)) + sum(1 for _ in others)
+
+        def is_free(box):
+            if not inside(box):
+                return False
+            return all(j == marker_box[i] for j in grid.overlaps(box))
+
+        best = next((k for k, box in enumerate(boxes) if is_free(box)), None)
+        if best is None and on_frontier[i]:
+            best = int(np.argmin([clashes(box) for box in boxes]))
+        if best is not None:
+            grid.add(boxes[best])
+            placed_texts[i] = texts[i]
+            positions[i] = POSITIONS[best]
+    return placed_texts, positions
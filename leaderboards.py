@@ -0,0 +1,61 @@
+import csv
+import hashlib
+import io
+from pathlib import Path
+
+from cache import atomic_path, prune_caches
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def with_efforts(df):
+    """Turn missing efforts into None, which the cost model uses for non-thinking models."""
+    if "effort" in df:
+        df["effort"] = df["effort"].astype(object).where(df["effort"].notna(), None)
+    return df
+
+
+def read_columns(name, data_dir=DATA_DIR):
+    """Read data/<name>.csv into a dict of column lists without pandas.
+
+    Values stay strings, with empty cells as None. This is the fast path for
+    queries that don't need a DataFrame.
+    """
+    with open(Path(data_dir) / f"{name}.csv", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = list(reader)
+    return {
+        column: [row[i] if row[i] != "" else None for row in rows]
+        for i, column in enumerate(header)
+    }
+
+
+def load_leaderboard(name, data_dir=DATA_DIR):
+    """Load data/<name>.csv as a DataFrame.
+
+    Parsed data is cached as an uncompressed Arrow file keyed on the CSV's
+    content hash, so repeated runs memory-map the columns instead of parsing
+    the CSV again. Without pyarrow the CSV is parsed every time.
+    """
+    import pandas as pd
+
+    path = Path(data_dir) / f"{name}.csv"
+    raw = path.read_bytes()
+
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return with_efforts(pd.read_csv(io.BytesIO(raw)))
+
+    cache_dir = Path(data_dir) / ".cache"
+    digest = hashlib.sha256(raw).hexdigest()[:16]
+    cache = cache_dir / f"{name}-{digest}.arrow"
+    if cache.exists():
+        return with_efforts(feather.read_table(cache, memory_map=True).to_pandas())
+
+    df = pd.read_csv(io.BytesIO(raw))
+    prune_caches(cache_dir, f"{name}-", ".arrow")
+    with atomic_path(cache) as tmp:
+        feather.write_feather(df, tmp, compression="uncompressed")
+    return with_efforts(df)
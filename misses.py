@@ -0,0 +1,64 @@
+import os
+import warnings
+
+from specs import PRICING_MODES
+
+# Reporting leaderboard models with no price. Kept apart from pricing.py so
+# that callers such as query.py can handle misses without importing NumPy.
+
+
+class PricingError(LookupError):
+    """Leaderboard models have no price in llm-prices.json (strict mode)."""
+
+    def __init__(self, misses):
+        self.misses = misses
+        super().__init__(format_misses(misses))
+
+
+class PricingWarning(UserWarning):
+    """Leaderboard models have no price and were left out (lenient mode)."""
+
+
+def get_pricing_mode(mode=None):
+    """Return `mode`, or PARETO_PRICING, or "lenient", checked against PRICING_MODES."""
+    mode = (mode or os.environ.get("PARETO_PRICING") or "lenient").lower()
+    if mode not in PRICING_MODES:
+        raise ValueError(
+            f"Unknown pricing mode {mode!r}; expected one of {', '.join(PRICING_MODES)}"
+        )
+    return mode
+
+
+def format_misses(misses):
+    """Render misses as one report, grouped by leaderboard."""
+    count = "1 model has" if len(misses) == 1 else f"{len(misses)} models have"
+    lines = [f"{count} no price in llm-prices.json:"]
+    by_leaderboard = {}
+    for miss in misses:
+        by_leaderboard.setdefault(miss["leaderboard"], []).append(miss)
+    for name, group in by_leaderboard.items():
+        lines.append(f"  {name}:")
+        for miss in group:
+            line = f"    {miss['model']}"
+            if miss["pricing_key"] != miss["model"]:
+                line += f" (pricing key {miss['pricing_key']!r})"
+            if miss["suggestion"] is not None:
+                line += (
+                    f", closest price: {miss['suggestion']!r}"
+                    f" ({miss['confidence']:.2f})"
+                )
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def check_misses(misses, mode=None):
+    """Raise PricingError for misses in strict mode, or warn about them in lenient mode."""
+    if not misses:
+        return
+    if get_pricing_mode(mode) == "strict":
+        raise PricingError(misses)
+    warnings.warn(
+        format_misses(misses) + "\nThese models are left out of the frontier.",
+        PricingWarning,
+        stacklevel=2,
+    )
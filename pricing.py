@@ -1,31 +1,624 @@
+import hashlib
 import json
+import os
+import re
+import warnings
 from pathlib import Path
 
+import numpy as np
 
-def load_pricing_data():
-    """Load pricing data from the JSON file and return a dictionary mapping model names to costs."""
-    json_path = Path(__file__).parent / "llm-prices.json"
+from cache import atomic_path, prune_caches
+
+# Miss reporting lives in the NumPy-free misses.py and the shared constants in
+# specs.py; they are re-exported here for callers of this module
+from misses import (
+    PricingError,
+    PricingWarning,
+    check_misses,
+    format_misses,
+    get_pricing_mode,
+)
+from specs import PRICES_PATH, PRICING_MODES
+
+CACHE_DIR = Path(__file__).parent / "data" / ".cache"
+
+# Context tier labels such as "≤200k" or ">128k"
+CONTEXT_LIMIT_RE = re.compile(r"^\s*(≤|<=|>)\s*([\d.]+)\s*([km]?)\s*$", re.IGNORECASE)
+TOKEN_SUFFIXES = {"": 1, "k": 1_000, "m": 1_000_000}
+
+# Cost multipliers for reasoning effort: thinking models cost 2x, high
+# thinking models 4x (2x for thinking times 2x for the high tier)
+EFFORT_MULTIPLIERS = {None: 1, "thinking": 2, "high": 4}
+
+# Date stamps in model names: 2025-04-16, 20250514, (06-05), (0528)
+DATE_RE = re.compile(r"\b(?:20\d\d-?\d\d-?\d\d|\d\d-\d\d|0\d{3})\b")
+# Words that describe a run of a model rather than the model itself
+QUALIFIER_TOKENS = {
+    "default",
+    "high",
+    "latest",
+    "low",
+    "max",
+    "medium",
+    "no",
+    "think",
+    "thinking",
+    "tokens",
+}
+# Words that name a distinct model within a family ("Gemini 2.5 Flash Lite" is
+# not "Gemini 2.5 Flash"), so a fuzzy match must agree on them like on versions
+VARIANT_TOKENS = {
+    "flash",
+    "haiku",
+    "large",
+    "lite",
+    "mini",
+    "nano",
+    "opus",
+    "plus",
+    "pro",
+    "small",
+    "sonnet",
+    "turbo",
+    "ultra",
+}
+# Fuzzy matches at or above this confidence are trusted for pricing
+FUZZY_THRESHOLD = 0.8
+# Resolver caches kept in data/.cache, most recently used first, so stores of
+# several price snapshots (see history.py) don't evict each other
+NAME_CACHES = 16
+# Names kept in each resolver cache file; the oldest are dropped first
+NAME_CACHE_SIZE = 2000
+
+# Parsed stores keyed by path, each kept with the file mtime it was parsed at
+_stores = {}
+
+
+def parse_context_limit(context_limit):
+    """Return the (exclusive low, inclusive high) prompt-token range of a context tier."""
+    if context_limit is None:
+        return -np.inf, np.inf
+    match = CONTEXT_LIMIT_RE.match(context_limit)
+    if match is None:
+        raise ValueError(f"Unrecognized context_limit: {context_limit!r}")
+    op, number, suffix = match.groups()
+    tokens = float(number) * TOKEN_SUFFIXES[suffix.lower()]
+    if op == ">":
+        return tokens, np.inf
+    return -np.inf, tokens
+
+
+def normalize_name(name):
+    """Normalize a model name for lookups: lowercase with runs of spaces, dashes and underscores collapsed."""
+    return re.sub(r"[\s_-]+", " ", name).strip().lower()
+
+
+class PricingStore:
+    """Parsed llm-prices.json with indexes for O(1) and batched cost lookups."""
+
+    def __init__(self, path=PRICES_PATH):
+        self.path = Path(path)
+        raw = self.path.read_bytes()
+        self.digest = hashlib.sha256(raw).hexdigest()[:16]
+        data = json.loads(raw)
+        self.last_updated = data.get("last_updated")
+
+        # One entry per row in the file, in file order
+        self.entries = []
+        for provider_info in data["models"]:
+            for model in provider_info["models"]:
+                self.entries.append(
+                    {
+                        "name": model["name"],
+                        "provider": provider_info["provider"],
+                        "context_limit": model.get("context_limit"),
+                        "input_price": model["input_price"],
+                        "output_price": model["output_price"],
+                    }
+                )
+
+        self.input_prices = np.array([e["input_price"] for e in self.entries])
+        self.output_prices = np.array([e["output_price"] for e in self.entries])
+        # Average cost (input + output) / 2
+        self.costs_by_entry = (self.input_prices + self.output_prices) / 2
+
+        # Prompt-token range each entry's price applies to
+        ranges = [parse_context_limit(e["context_limit"]) for e in self.entries]
+        self.tier_low = np.array([low for low, _ in ranges])
+        self.tier_high = np.array([high for _, high in ranges])
+
+        # All tiers of a model share a group; names index the base (shortest
+        # context) tier, which is what a typical prompt is billed at
+        self.by_name = {}
+        self.by_normalized_name = {}
+        self.by_provider = {}
+        self.by_tier = {}
+        self.tiers = {}
+        for i, entry in enumerate(self.entries):
+            self.tiers.setdefault(entry["name"], []).append(i)
+            self.by_provider.setdefault(entry["provider"], []).append(i)
+            self.by_tier[(entry["name"], entry["context_limit"])] = i
+        group_of_name = {}
+        self.group = np.empty(len(self.entries), dtype=np.intp)
+        for name, indexes in self.tiers.items():
+            indexes.sort(key=lambda i: self.tier_low[i])
+            group_of_name[name] = len(group_of_name)
+            self.group[indexes] = group_of_name[name]
+            self.by_name[name] = indexes[0]
+            self.by_normalized_name[normalize_name(name)] = indexes[0]
+
+        # Base tier of every entry's model
+        self.base_tier = np.array([self.by_name[e["name"]] for e in self.entries])
+        self._resolver = None
+
+    def index(self, model_name):
+        """Return the entry index for a model name, or -1 if it is unknown.
+
+        Missing names (None from the csv module, NaN from pandas) are unknown.
+        """
+        if not isinstance(model_name, str):
+            return -1
+        i = self.by_name.get(model_name)
+        if i is None:
+            i = self.by_normalized_name.get(normalize_name(model_name), -1)
+        return i
+
+    def indexes(self, model_names, min_confidence=None):
+        """Return the entry indexes for a list of model names as a NumPy array.
+
+        With `min_confidence`, names with no exact match fall back to the
+        fuzzy resolver's match when its confidence is at least that high.
+        """
+        indexes = np.fromiter(
+            (self.index(name) for name in model_names),
+            dtype=np.intp,
+            count=len(model_names),
+        )
+        if min_confidence is not None and (indexes < 0).any():
+            misses = np.flatnonzero(indexes < 0)
+            names = [n if isinstance(n, str) else "" for n in model_names]
+            matches, confidences = self.resolver.resolve([names[i] for i in misses])
+            fuzzy = [self.by_name[m] if m is not None else -1 for m in matches]
+            indexes[misses] = np.where(confidences >= min_confidence, fuzzy, -1)
+        return indexes
+
+    @property
+    def resolver(self):
+        """Fuzzy name resolver over this store's model names, built on first use."""
+        if self._resolver is None:
+            # Cached matches depend on the prices and on the matching rules
+            rules = json.dumps(
+                [DATE_RE.pattern, sorted(QUALIFIER_TOKENS), sorted(VARIANT_TOKENS)]
+            )
+            digest = hashlib.sha256((self.digest + rules).encode()).hexdigest()[:16]
+            cache_path = CACHE_DIR / f"names-{digest}.json"
+            if cache_path.exists():
+                # Mark it as recently used
+                cache_path.touch()
+            else:
+                prune_caches(CACHE_DIR, "names-", ".json", keep=NAME_CACHES - 1)
+            self._resolver = NameResolver(list(self.by_name), cache_path)
+        return self._resolver
+
+    def canonical_name(self, model_name):
+        """Return the name used in llm-prices.json for a model, or None."""
+        i = self.index(model_name)
+        return self.entries[i]["name"] if i >= 0 else None
+
+    def cost(self, model_name, default=0, context_tokens=None, weights=None):
+        """Get the average cost for a model (see `costs` for the context arguments)."""
+        return float(self.costs([model_name], default, context_tokens, weights)[0])
+
+    def costs(self, model_names, default=0.0, context_tokens=None, weights=None):
+        """Get the average costs for a list of models as a NumPy array.
+
+        Models with context tiers are priced at their base tier by default.
+        `context_tokens` picks the tier covering a prompt length, or, given a
+        list of prompt lengths (optionally with `weights`), prices each model
+        at the expected cost over that distribution.
+        """
+        indexes = self.indexes(model_names)
+        input_prices, output_prices = self.tiered_prices(context_tokens, weights)
+        tiered_costs = (input_prices + output_prices) / 2
+        return np.where(indexes >= 0, tiered_costs[indexes], default)
+
+    def tiered_prices(self, context_tokens=None, weights=None, output_weights=None):
+        """Return (input, output) prices of every entry's model for a prompt-length distribution.
+
+        Each entry gets the expected prices of its model across all of that
+        model's tiers, so any entry index can be used to look them up.
+        `output_weights` weights the prompt lengths for output prices when it
+        differs from `weights`, for example by each request's output tokens.
+        """
+        if context_tokens is None:
+            return self.input_prices[self.base_tier], self.output_prices[self.base_tier]
+
+        tokens = np.atleast_1d(np.asarray(context_tokens, dtype=float))
+        weights = np.ones(len(tokens)) if weights is None else np.asarray(weights)
+        output_weights = weights if output_weights is None else output_weights
+
+        # Tier each prompt length falls into, for every entry
+        in_tier = (tokens > self.tier_low[:, None]) & (
+            tokens <= self.tier_high[:, None]
+        )
+        expected = []
+        for prices, w in (
+            (self.input_prices, weights),
+            (self.output_prices, output_weights),
+        ):
+            w = np.asarray(w, dtype=float)
+            # Share of the distribution that falls into each entry's tier
+            share = in_tier @ (w / w.sum())
+            expected.append(
+                np.bincount(
+                    self.group, weights=share * prices, minlength=len(self.tiers)
+                )
+            )
+        return expected[0][self.group], expected[1][self.group]
+
+    def tier_entries(self, model_name):
+        """Return every context tier of a model, shortest context first."""
+        name = self.canonical_name(model_name)
+        return [self.entries[i] for i in self.tiers.get(name, [])]
+
+    def provider_models(self, provider):
+        """Return the entries for a provider, in file order."""
+        return [self.entries[i] for i in self.by_provider.get(provider, [])]
+
+    def as_dict(self):
+        """Return a flat mapping from model name to average cost."""
+        return {name: float(self.costs_by_entry[i]) for name, i in self.by_name.items()}
+
+
+def name_tokens(name):
+    """Reduce a model name to the tokens that identify the model.
+
+    Lowercases, drops date stamps, run qualifiers ("high", "thinking", "32k")
+    and punctuation, and splits version numbers, so "claude-3-7-sonnet-20250219
+    (32k thinking)" and "Claude 3.7 Sonnet" both become "claude 3 7 sonnet".
+    """
+    name = DATE_RE.sub(" ", name.lower())
+    tokens = re.split(r"[^a-z0-9]+", name)
+    return " ".join(
+        t
+        for t in tokens
+        if t and t not in QUALIFIER_TOKENS and not re.fullmatch(r"\d+k", t)
+    )
+
+
+def variant_signature(key):
+    """The tokens of a key that identify the exact model, as one string.
 
-    with open(json_path, "r") as f:
-        data = json.load(f)
+    These are the tokens that carry digits (versions and sizes) and the
+    VARIANT_TOKENS.
+    """
+    return " ".join(
+        sorted(
+            t for t in key.split() if t in VARIANT_TOKENS or any(c.isdigit() for c in t)
+        )
+    )
 
-    # Create a mapping from model name to average cost (input + output) / 2
-    pricing = {}
 
-    for provider_info in data["models"]:
-        for model in provider_info["models"]:
-            avg_cost = (model["input_price"] + model["output_price"]) / 2
-            pricing[model["name"]] = avg_cost
+def trigrams(key):
+    """Character trigrams of a key, padded so word boundaries count."""
+    padded = f"  {key} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
 
-    return pricing
 
+class NameResolver:
+    """Matches free-form model names to known names with a confidence score.
 
-def get_model_cost(model_name, pricing_data):
-    """Get the cost for a model."""
+    Known names are indexed once as a (names, trigrams) incidence matrix, so a
+    batch of queries is scored against every name with one matrix product.
+    Confidence is 1 for an identical token key and otherwise the Dice
+    similarity of the trigram sets, halved when the version numbers or variant
+    words differ, so "Claude 3.7 Sonnet" doesn't confidently match "Claude 3
+    Sonnet" nor "Gemini 2.5 Flash Lite" match "Gemini 2.5 Flash". Results are
+    cached in memory and, for batches resolved with `persist` when `cache_path`
+    is given, on disk (up to NAME_CACHE_SIZE names), so re-runs don't score
+    them again.
+    """
+
+    def __init__(self, names, cache_path=None):
+        self.names = list(names)
+        self.keys = [name_tokens(name) for name in self.names]
+        self.by_key = {}
+        for i, key in enumerate(self.keys):
+            self.by_key.setdefault(key, i)
+
+        grams = [trigrams(key) for key in self.keys]
+        self.vocabulary = {g: j for j, g in enumerate(sorted(set().union(*grams)))}
+        self.matrix = np.zeros((len(self.names), len(self.vocabulary)))
+        for i, gs in enumerate(grams):
+            self.matrix[i, [self.vocabulary[g] for g in gs]] = 1
+        self.sizes = self.matrix.sum(axis=1)
+        self.variants = np.array([variant_signature(key) for key in self.keys])
+
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        # Persisted matches, oldest first, and matches kept for this process only
+        self.cache = {}
+        self.scratch = {}
+        if self.cache_path is not None and self.cache_path.exists():
+            with open(self.cache_path, "r") as f:
+                self.cache = dict(list(json.load(f).items())[-NAME_CACHE_SIZE:])
+
+    def score(self, queries):
+        """Return the (queries, names) confidence matrix for a list of names."""
+        keys = [name_tokens(query) for query in queries]
+        query_matrix = np.zeros((len(queries), len(self.vocabulary)))
+        query_sizes = np.zeros(len(queries))
+        for q, key in enumerate(keys):
+            gs = trigrams(key)
+            query_sizes[q] = len(gs)
+            known = [self.vocabulary[g] for g in gs if g in self.vocabulary]
+            query_matrix[q, known] = 1
+        shared = query_matrix @ self.matrix.T
+        dice = 2 * shared / (query_sizes[:, None] + self.sizes[None, :])
+        variants = np.array([variant_signature(key) for key in keys])
+        same_variant = variants[:, None] == self.variants[None, :]
+        return np.where(same_variant, dice, dice / 2)
+
+    def resolve(self, queries, persist=False):
+        """Match each query to its best known name.
+
+        Returns (names, confidences): the best match per query (None when
+        nothing shares a trigram) and its confidence in [0, 1]. With `persist`,
+        the batch's matches are written to the disk cache in one go.
+        """
+        queries = list(queries)
+        if persist:
+            # Matches found earlier in this process are persisted too
+            for q in set(queries) & set(self.scratch):
+                self.cache[q] = self.scratch.pop(q)
+        known = {**self.scratch, **self.cache}
+        new = sorted(set(q for q in queries if q not in known))
+        found = {}
+        if new:
+            scores = self.score(new) if self.names else np.zeros((len(new), 0))
+            for q, query in enumerate(new):
+                exact = self.by_key.get(name_tokens(query))
+                if exact is not None:
+                    found[query] = [self.names[exact], 1.0]
+                elif scores.shape[1] and scores[q].max() > 0:
+                    best = int(scores[q].argmax())
+                    found[query] = [self.names[best], float(scores[q, best])]
+                else:
+                    found[query] = [None, 0.0]
+            known.update(found)
+        if persist:
+            self.cache.update(found)
+            self.save()
+        else:
+            self.scratch.update(found)
+
+        matches = [known[q][0] for q in queries]
+        confidences = np.array([known[q][1] for q in queries], dtype=float)
+        return matches, confidences
+
+    def save(self):
+        """Write the newest NAME_CACHE_SIZE cached names to disk, if the resolver has a cache path."""
+        if self.cache_path is None:
+            return
+        self.cache = dict(list(self.cache.items())[-NAME_CACHE_SIZE:])
+        with atomic_path(self.cache_path) as tmp, open(tmp, "w") as f:
+            json.dump(self.cache, f, indent=2)
+
+
+def find_misses(leaderboards, store=None, suggest=True):
+    """Check the pricing keys of several leaderboards in one batched lookup.
+
+    `leaderboards` maps a name to (models, pricing_keys). Returns one dict per
+    row whose key has no price, with its leaderboard, model, pricing_key and
+    the fuzzy resolver's closest llm-prices.json name as suggestion (None if
+    there is none, or without `suggest`) with its confidence. Suggestions are
+    cached on disk, one write per call.
+    """
+    store = store or get_pricing_store()
+    rows = [
+        (name, model, key if isinstance(key, str) else "")
+        for name, (models, keys) in leaderboards.items()
+        for model, key in zip(models, keys)
+    ]
+    indexes = store.indexes([key for _, _, key in rows])
+    missing = [rows[i] for i in np.flatnonzero(indexes < 0)]
+    if not missing:
+        return []
+
+    keys = sorted(set(key for _, _, key in missing))
+    if suggest:
+        matches, confidences = store.resolver.resolve(keys, persist=True)
+        suggestions = dict(zip(keys, zip(matches, confidences.tolist())))
+    else:
+        suggestions = dict.fromkeys(keys, (None, 0.0))
+    return [
+        {
+            "leaderboard": name,
+            "model": model,
+            "pricing_key": key,
+            "suggestion": suggestions[key][0],
+            "confidence": suggestions[key][1],
+        }
+        for name, model, key in missing
+    ]
+
+
+def get_pricing_store(path=PRICES_PATH):
+    """Return the parsed pricing store, re-reading the file only when its mtime changes."""
+    path = Path(path)
+    mtime = path.stat().st_mtime_ns
+    cached = _stores.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, PricingStore(path))
+        _stores[path] = cached
+    return cached[1]
+
+
+class CostModel:
+    """Blends input and output prices into one cost per million tokens for a workload.
+
+    The default 1:1 token mix gives the (input + output) / 2 average. Thinking
+    and high effort rows are scaled by EFFORT_MULTIPLIERS, with any efforts
+    in `effort_multipliers` overridden, and
+    `output_overheads` maps model names to a factor on their output tokens for
+    models that spend extra reasoning tokens. When `context_tokens` is given
+    (a prompt length, or a list of them with `context_weights`), models are
+    priced across their context tiers for that distribution; `output_weights`
+    weights the prompt lengths for output prices instead, if given.
+    """
+
+    def __init__(
+        self,
+        input_tokens=1,
+        output_tokens=1,
+        effort_multipliers=None,
+        output_overheads=None,
+        context_tokens=None,
+        context_weights=None,
+        output_weights=None,
+    ):
+        total = input_tokens + output_tokens
+        self.input_share = input_tokens / total
+        self.output_share = output_tokens / total
+        # Overrides are merged over the defaults, so they can name only some efforts
+        self.effort_multipliers = {**EFFORT_MULTIPLIERS, **(effort_multipliers or {})}
+        self.output_overheads = dict(output_overheads or {})
+        self.context_tokens = context_tokens
+        self.context_weights = context_weights
+        self.output_weights = output_weights
+
+    @classmethod
+    def from_histogram(cls, input_tokens, output_tokens, counts=None, **kwargs):
+        """Build a cost model from per-request token counts (optionally weighted by `counts`).
+
+        A request's prompt length picks the tier its tokens are billed at, so
+        each tier's input price is weighted by the input tokens billed in it
+        and its output price by the output tokens.
+        """
+        input_tokens = np.asarray(input_tokens, dtype=float)
+        output_tokens = np.asarray(output_tokens, dtype=float)
+        counts = np.ones(len(input_tokens)) if counts is None else np.asarray(counts)
+        return cls(
+            input_tokens=float(input_tokens @ counts),
+            output_tokens=float(output_tokens @ counts),
+            context_tokens=input_tokens,
+            context_weights=input_tokens * counts,
+            output_weights=output_tokens * counts,
+            **kwargs,
+        )
+
+    def describe(self):
+        """Return the model's parameters as JSON-serializable data."""
+
+        def as_list(values):
+            return None if values is None else np.atleast_1d(values).tolist()
+
+        return {
+            "input_share": self.input_share,
+            "output_share": self.output_share,
+            "effort_multipliers": {
+                str(effort): multiplier
+                for effort, multiplier in self.effort_multipliers.items()
+            },
+            "output_overheads": self.output_overheads,
+            "context_tokens": as_list(self.context_tokens),
+            "context_weights": as_list(self.context_weights),
+            "output_weights": as_list(self.output_weights),
+        }
+
+    def costs(
+        self, model_names, efforts=None, store=None, default=0.0, min_confidence=None
+    ):
+        """Get the blended costs for a list of models as a NumPy array.
+
+        `efforts` gives each row's reasoning effort (None, "thinking" or "high").
+        `min_confidence` prices names with no exact match by their fuzzy match
+        (see `PricingStore.indexes`).
+        """
+        store = store or get_pricing_store()
+        indexes = store.indexes(model_names, min_confidence)
+        input_prices, output_prices = store.tiered_prices(
+            self.context_tokens, self.context_weights, self.output_weights
+        )
+
+        # Output token overhead for each entry's model
+        overheads = np.ones(len(store.entries))
+        for name, factor in self.output_overheads.items():
+            canonical = store.canonical_name(name)
+            if canonical is not None:
+                overheads[store.tiers[canonical]] = factor
+
+        blended = (
+            self.input_share * input_prices
+            + self.output_share * overheads * output_prices
+        )
+        costs = np.where(indexes >= 0, blended[indexes], default)
+
+        if efforts is not None:
+            costs = costs * np.fromiter(
+                (self.effort_multipliers[effort] for effort in efforts),
+                dtype=float,
+                count=len(efforts),
+            )
+        return costs
+
+
+def get_cost_model(effort_multipliers=None):
+    """Return the default cost model, using PARETO_IO_RATIO (e.g. "10:1") for the token mix if set."""
+    ratio = os.environ.get("PARETO_IO_RATIO")
+    if not ratio:
+        return CostModel(effort_multipliers=effort_multipliers)
+    input_tokens, output_tokens = (float(part) for part in ratio.split(":"))
+    return CostModel(input_tokens, output_tokens, effort_multipliers)
+
+
+def price_leaderboards(leaderboards, cost_model=None, store=None):
+    """Price several leaderboards in one vectorized pass.
+
+    `leaderboards` maps a name to (pricing_keys, efforts); returns a mapping
+    from the same names to arrays of costs.
+    """
+    cost_model = cost_model or get_cost_model()
+    names = list(leaderboards)
+    keys = [key for name in names for key in leaderboards[name][0]]
+    efforts = [effort for name in names for effort in leaderboards[name][1]]
+    costs = cost_model.costs(keys, efforts, store)
+    sizes = [len(leaderboards[name][0]) for name in names]
+    return dict(zip(names, np.split(costs, np.cumsum(sizes)[:-1])))
+
+
+def load_pricing_data():
+    """Load pricing data from the JSON file and return a dictionary mapping model names to costs."""
+    return get_pricing_store().as_dict()
+
+
+def get_model_cost(model_name, pricing_data, mode=None):
+    """Get the cost for a model.
+
+    Unknown models raise PricingError in strict mode. In lenient mode they
+    still cost 0, as callers of this function expect, but with a
+    PricingWarning (without the resolver's suggestion, which would be too
+    slow per call). Charts don't use this; see `check_misses` for how they
+    handle misses.
+    """
 
     # Direct lookup in pricing data
     if model_name in pricing_data:
         return pricing_data[model_name]
 
+    # Fall back to the name as written in llm-prices.json (case and separators ignored)
+    canonical = get_pricing_store().canonical_name(model_name)
+    if canonical in pricing_data:
+        return pricing_data[canonical]
+
+    misses = find_misses(
+        {"get_model_cost": ([model_name], [model_name])}, suggest=False
+    )
+    if get_pricing_mode(mode) == "strict":
+        raise PricingError(misses)
+    warnings.warn(
+        format_misses(misses) + "\nget_model_cost() prices it at 0.",
+        PricingWarning,
+        stacklevel=2,
+    )
     # Return 0 for models not found in pricing data
     return 0
@@ -0,0 +1,171 @@
+import contextlib
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Profiler of the chart being run, or None when profiling is off
+_active = None
+# What `stage` returns when profiling is off
+_NULL_STAGE = contextlib.nullcontext()
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process so far, in MB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+class Profiler:
+    """Stage timings, peak memory and counters for one chart run."""
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.stages = []
+        self.counters = {}
+        self.depth = 0
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time a pipeline stage; stages may nest."""
+        record = {
+            "name": name,
+            "start": time.perf_counter() - self.start,
+            "depth": self.depth,
+        }
+        self.stages.append(record)
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            record["seconds"] = time.perf_counter() - self.start - record["start"]
+            record["peak_rss_mb"] = peak_rss_mb()
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self):
+        """The run as JSON-serializable data (picklable across processes)."""
+        return {
+            "chart": self.name,
+            "pid": os.getpid(),
+            "start": self.start,
+            "seconds": time.perf_counter() - self.start,
+            "peak_rss_mb": peak_rss_mb(),
+            "stages": self.stages,
+            "counters": self.counters,
+        }
+
+
+def start(name):
+    """Start profiling a chart run; the pipeline's stages report to it until `stop`."""
+    global _active
+    _active = Profiler(name)
+    return _active
+
+
+def stop():
+    """Stop profiling and return the run's report."""
+    global _active
+    profiler, _active = _active, None
+    return profiler.report()
+
+
+def stage(name):
+    """Context manager timing a pipeline stage (a shared no-op when profiling is off)."""
+    if _active is None:
+        return _NULL_STAGE
+    return _active.stage(name)
+
+
+def count(name, value=1):
+    """Add `value` to a counter of the current run (ignored when profiling is off)."""
+    if _active is not None:
+        _active.count(name, value)
+
+
+def format_report(report):
+    """Render a run's report as an indented table of stages."""
+
+    def memory(mb):
+        return f"{mb:>9.1f} MB" if mb is not None else ""
+
+    lines = [
+        f"{report['chart']}: {report['seconds']:.3f}s, "
+        f"peak memory {memory(report['peak_rss_mb']).strip() or 'unknown'}"
+    ]
+    for record in report["stages"]:
+        name = "  " * record["depth"] + record["name"]
+        lines.append(
+            f"  {name:<20} {record['seconds']:>8.3f}s"
+            f"{memory(record['peak_rss_mb'])}"
+        )
+    if report["counters"]:
+        lines.append(
+            "  "
+            + " ".join(f"{name}={value}" for name, value in report["counters"].items())
+        )
+    return "\n".join(lines)
+
+
+def chrome_trace(reports):
+    """Combine reports into a Chrome trace (chrome://tracing, Perfetto, speedscope).
+
+    Each chart gets its own track, named after it; counters are attached to
+    the chart's first event.
+    """
+    origin = min((report["start"] for report in reports), default=0.0)
+    events = []
+    for tid, report in enumerate(reports):
+        offset = (report["start"] - origin) * 1e6
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": report["pid"],
+                "tid": tid,
+                "args": {"name": report["chart"]},
+            }
+        )
+        events.append(
+            {
+                "name": report["chart"],
+                "cat": "chart",
+                "ph": "X",
+                "ts": offset,
+                "dur": report["seconds"] * 1e6,
+                "pid": report["pid"],
+                "tid": tid,
+                "args": dict(report["counters"], peak_rss_mb=report["peak_rss_mb"]),
+            }
+        )
+        for record in report["stages"]:
+            events.append(
+                {
+                    "name": record["name"],
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": offset + record["start"] * 1e6,
+                    "dur": record["seconds"] * 1e6,
+                    "pid": report["pid"],
+                    "tid": tid,
+                    "args": {"peak_rss_mb": record["peak_rss_mb"]},
+                }
+            )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_trace(reports, path):
+    """Write reports as a Chrome trace JSON file."""
+    with open(path, "w") as f:
+        json.dump(chrome_trace(reports), f)
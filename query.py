@@ -0,0 +1,215 @@
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+import warnings
+from pathlib import Path
+
+from cache import atomic_path, prune_caches
+from leaderboards import DATA_DIR
+from misses import PricingError, PricingWarning, check_misses
+from specs import CHARTS, CHARTS_BY_NAME, PRICES_PATH, PRICING_MODES, engine_hash
+
+CACHE_DIR = DATA_DIR / ".cache"
+FORMATS = ("json", "csv", "arrow")
+COLUMNS = (
+    "model",
+    "cost",
+    "score",
+    "on_frontier",
+    "dominated_by",
+    "score_gap",
+    "cost_ratio",
+)
+
+# Results (rows, misses) already loaded in this process, keyed by chart name
+# and the (mtime, size) of its inputs
+_results = {}
+
+
+def input_paths(chart):
+    """Files a chart's query result is computed from."""
+    return [DATA_DIR / f"{chart['name']}.csv", PRICES_PATH]
+
+
+def cache_key(chart):
+    """Hash every input of a chart's query result."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(chart, sort_keys=True).encode())
+    for path in input_paths(chart):
+        digest.update(path.read_bytes())
+    digest.update(engine_hash().encode())
+    digest.update(Path(__file__).read_bytes())
+    digest.update(os.environ.get("PARETO_IO_RATIO", "").encode())
+    return digest.hexdigest()[:16]
+
+
+def compute(chart):
+    """Price a chart and measure every model against its frontier.
+
+    Returns (rows, misses): one row per priced model, ordered by cost, with
+    the COLUMNS fields, and the `pricing.find_misses` of the models left out
+    for having no price. `dominated_by` names a model that dominates it, and
+    `score_gap` and `cost_ratio` are from `frontier.domination_margins` (None
+    for an infinite ratio).
+    """
+    import numpy as np
+
+    from charts import chart_arrays, pricing_misses
+    from frontier import domination_margins, pareto_frontier
+
+    misses = pricing_misses([chart])
+    with warnings.catch_warnings():
+        # The misses are kept with the rows and checked on every query
+        warnings.simplefilter("ignore", PricingWarning)
+        models, cost, score = chart_arrays(chart, "lenient")
+    frontier, dominated_by = pareto_frontier(cost, score, chart["equal_cost"])
+    score_gap, cost_ratio = domination_margins(cost, score)
+    on_frontier = dominated_by < 0
+    score_gap[on_frontier] = 0.0
+    cost_ratio[on_frontier] = 1.0
+
+    rows = [
+        {
+            "model": models[i],
+            "cost": float(cost[i]),
+            "score": float(score[i]),
+            "on_frontier": bool(on_frontier[i]),
+            "dominated_by": None if on_frontier[i] else models[dominated_by[i]],
+            "score_gap": float(score_gap[i]),
+            "cost_ratio": float(cost_ratio[i]) if np.isfinite(cost_ratio[i]) else None,
+        }
+        for i in np.argsort(cost, kind="stable")
+    ]
+    return rows, misses
+
+
+def load(name):
+    """Return a chart's (rows, misses), computing them on a cache miss."""
+    chart = CHARTS_BY_NAME[name]
+    stamp = tuple(
+        (path.stat().st_mtime_ns, path.stat().st_size) for path in input_paths(chart)
+    ) + (os.environ.get("PARETO_IO_RATIO"),)
+    cached = _results.get(name)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    path = CACHE_DIR / f"query-{name}-{cache_key(chart)}.json"
+    if path.exists():
+        with open(path, "r") as f:
+            result = json.load(f)
+    else:
+        rows, misses = compute(chart)
+        result = {"rows": rows, "misses": misses}
+        prune_caches(CACHE_DIR, f"query-{name}-", ".json")
+        with atomic_path(path) as tmp, open(tmp, "w") as f:
+            json.dump(result, f)
+
+    _results[name] = (stamp, (result["rows"], result["misses"]))
+    return _results[name][1]
+
+
+def query(name, pricing_mode=None):
+    """Return a chart's per-model frontier membership, margins and costs.
+
+    Results are precomputed once per set of inputs and cached on disk in
+    data/.cache, and in memory for the life of the process, so repeated queries
+    are a dictionary lookup and a cache hit never imports NumPy or pandas.
+    Models with no price are left out of the rows. They are cached alongside
+    them and checked against `pricing_mode` on every query (see
+    `misses.check_misses`), so strict mode raises PricingError even on a hit.
+    """
+    rows, misses = load(name)
+    check_misses(misses, pricing_mode)
+    return rows
+
+
+def query_all(names=None, frontier_only=False, pricing_mode=None):
+    """Query several charts; returns chart name -> rows.
+
+    In strict mode the misses of all charts are raised as one PricingError.
+    """
+    names = names or [chart["name"] for chart in CHARTS]
+    misses = [miss for name in names for miss in load(name)[1]]
+    check_misses(misses, pricing_mode)
+
+    results = {}
+    for name in names:
+        rows = load(name)[0]
+        results[name] = [r for r in rows if r["on_frontier"]] if frontier_only else rows
+    return results
+
+
+def flatten(results):
+    """One row per (chart, model), with the chart name as the first column."""
+    return [dict(chart=name, **row) for name, rows in results.items() for row in rows]
+
+
+def write_results(results, fmt, output=None):
+    """Write query results as JSON, CSV or an Arrow IPC file to `output` or stdout."""
+    if fmt == "json":
+        text = json.dumps(results, indent=2)
+    elif fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=("chart",) + COLUMNS)
+        writer.writeheader()
+        writer.writerows(flatten(results))
+        text = buffer.getvalue()
+    elif fmt == "arrow":
+        import pyarrow as pa
+
+        table = pa.Table.from_pylist(flatten(results))
+        sink = output or sys.stdout.buffer
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        return
+    else:
+        raise ValueError(f"Unknown format: {fmt!r}")
+
+    if output is None:
+        sys.stdout.write(text if text.endswith("\n") else text + "\n")
+    else:
+        Path(output).write_text(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Print each leaderboard's frontier membership, domination "
+        "margins and costs."
+    )
+    parser.add_argument(
+        "charts",
+        nargs="*",
+        help="Chart names (default: all). "
+        + ", ".join(chart["name"] for chart in CHARTS),
+    )
+    parser.add_argument("--format", choices=FORMATS, default="json")
+    parser.add_argument(
+        "--frontier-only", action="store_true", help="Only list frontier models."
+    )
+    parser.add_argument("--output", help="Write to this file instead of stdout.")
+    parser.add_argument(
+        "--pricing",
+        choices=PRICING_MODES,
+        default=None,
+        help="Leave models with no price out with a warning (lenient, the "
+        "default), or exit with status 1 and a report of them (strict). Or set "
+        "PARETO_PRICING.",
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.charts) - set(CHARTS_BY_NAME)
+    if unknown:
+        parser.error(f"unknown charts: {', '.join(sorted(unknown))}")
+    try:
+        results = query_all(args.charts, args.frontier_only, args.pricing)
+    except PricingError as e:
+        sys.exit(str(e))
+    write_results(results, args.format, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+from charts import (
+    CHARTS,
+    SIZES,
+    THUMBNAIL,
+    chart_fingerprint,
+    is_stale,
+    load_manifest,
+    pricing_misses,
+    render_charts,
+    save_manifest,
+)
+from dashboard import write_dashboard
+from pricing import PRICING_MODES, PricingWarning, format_misses, get_pricing_mode
+from profiling import format_report, write_trace
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build and export every Pareto chart in a single run."
+    )
+    parser.add_argument(
+        "charts",
+        nargs="*",
+        help="Chart names to render (default: all). "
+        + ", ".join(chart["name"] for chart in CHARTS),
+    )
+    parser.add_argument(
+        "--output-dir", default=".", help="Directory to write images to."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: one per CPU core).",
+    )
+    parser.add_argument(
+        "--thumbnails",
+        action="store_true",
+        help=f"Also export {THUMBNAIL[1]}x{THUMBNAIL[2]} thumbnails "
+        f"(*{THUMBNAIL[0]}.png).",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every chart, even if its inputs have not changed.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("png", "html"),
+        default="png",
+        help="Export PNG images, or one interactive HTML dashboard (index.html) "
+        "that needs no kaleido.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time and peak memory of each chart's pipeline stages.",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Also write every chart's profile to one Chrome trace JSON file "
+        "(implies --profile).",
+    )
+    parser.add_argument(
+        "--pricing",
+        choices=PRICING_MODES,
+        default=None,
+        help="Render charts without their unpriced models (lenient, the default), "
+        "or render nothing if any model has no price (strict). Or set "
+        "PARETO_PRICING.",
+    )
+    parser.add_argument(
+        "--check-pricing",
+        action="store_true",
+        help="Only check that every leaderboard model has a price, and exit "
+        "with status 1 if not.",
+    )
+    args = parser.parse_args()
+    profile = args.profile or bool(args.trace)
+
+    selected = [c for c in CHARTS if not args.charts or c["name"] in args.charts]
+    unknown = set(args.charts) - {c["name"] for c in CHARTS}
+    if unknown:
+        parser.error(f"unknown charts: {', '.join(sorted(unknown))}")
+
+    # Check every chart's prices in one pass before rendering any of them
+    misses = pricing_misses(selected)
+    if misses:
+        print(format_misses(misses), file=sys.stderr)
+    if args.check_pricing:
+        if misses:
+            sys.exit(1)
+        print(f"Every model of {len(selected)} charts has a price")
+        return
+    if misses:
+        if get_pricing_mode(args.pricing) == "strict":
+            print("Nothing rendered (strict pricing)", file=sys.stderr)
+            sys.exit(1)
+        print("These models are left out of their charts", file=sys.stderr)
+        # Already reported above, so don't warn again for each chart
+        warnings.simplefilter("ignore", PricingWarning)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if args.format == "html":
+        start = time.perf_counter()
+        path = write_dashboard(selected, output_dir)
+        print(
+            f"Wrote {len(selected)} charts to {path} "
+            f"({path.stat().st_size / 1e6:.1f} MB) in "
+            f"{time.perf_counter() - start:.2f}s"
+        )
+        return
+
+    sizes = SIZES + [THUMBNAIL] if args.thumbnails else SIZES
+
+    # Only re-render charts whose inputs changed since the last run
+    manifest = load_manifest(output_dir)
+    fingerprints = {c["name"]: chart_fingerprint(c, sizes) for c in selected}
+    stale = [
+        c
+        for c in selected
+        if args.force or is_stale(c, fingerprints[c["name"]], manifest, output_dir)
+    ]
+    if len(stale) < len(selected):
+        print(f"{len(selected) - len(stale)} of {len(selected)} charts up to date")
+
+    results = render_charts(stale, output_dir, sizes, args.jobs, profile)
+
+    for result in results:
+        if not result["error"]:
+            manifest[result["name"]] = {
+                "fingerprint": fingerprints[result["name"]],
+                "outputs": [Path(path).name for path in result["outputs"]],
+            }
+    save_manifest(output_dir, manifest)
+
+    print(f"{'chart':<28} {'build':>8} {'export':>8} {'total':>8}")
+    for result in results:
+        if result["error"]:
+            print(f"{result['name']:<28} FAILED: {result['error']}")
+            continue
+        total = result["build"] + result["export"]
+        print(
+            f"{result['name']:<28} {result['build']:>7.2f}s "
+            f"{result['export']:>7.2f}s {total:>7.2f}s"
+        )
+
+    if profile:
+        # Charts whose worker or kaleido session failed have no profile
+        reports = [result["profile"] for result in results if "profile" in result]
+        for report in reports:
+            print("\n" + format_report(report))
+        if args.trace:
+            write_trace(reports, args.trace)
+
+    failed = [result["name"] for result in results if result["error"]]
+    if failed:
+        print(f"{len(failed)} of {len(results)} charts failed", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import functools
+import hashlib
+from pathlib import Path
+
+# Source files that every chart's output depends on
+ENGINE_FILES = (
+    "charts.py",
+    "frontier.py",
+    "labels.py",
+    "leaderboards.py",
+    "pricing.py",
+    "specs.py",
+)
+
+PRICES_PATH = Path(__file__).parent / "llm-prices.json"
+# What to do with leaderboard models that have no price: "lenient" leaves them
+# off the chart with a warning, "strict" stops before anything is plotted
+PRICING_MODES = ("lenient", "strict")
+
+# Declarative chart specs. Each chart reads data/<name>.csv; rows with a
+# pricing_key column are priced from llm-prices.json through the cost model
+# (with the per-row effort multipliers), otherwise the CSV's own cost column is
+# used. Keys:
+# - name: chart name, also the data file name
+# - source: where the leaderboard data comes from, and how it was filtered
+# - output: exported image
+# - title, xaxis_title, yaxis_title: chart labels
+# - score: score column plotted against cost
+# - equal_cost: frontier tie rule for models with the same cost (see frontier.py)
+# - text_size: label font size
+# - effort_multipliers: optional override of pricing.EFFORT_MULTIPLIERS
+# - drop_unpriced: drop rows with a missing or non-positive cost
+CHARTS = [
+    {
+        "name": "aa",
+        "source": (
+            "Intelligence Index scores from https://artificialanalysis.ai/, "
+            "limited to o3 (not o3-mini or o3-pro), o4-mini, GPT-4o (ChatGPT), "
+            "GPT-4.1 and all Claude 4 and Gemini 2.5 models"
+        ),
+        "output": "pareto-aa.png",
+        "title": "LLM Pareto Frontier: Cost vs Artificial Analysis Intelligence Index",
+        "xaxis_title": "Cost ($) - Blended per Million Tokens",
+        "yaxis_title": "Artificial Analysis Intelligence Index",
+        "score": "intelligence_score",
+        "equal_cost": "best",
+        "text_size": 8,
+    },
+    {
+        "name": "aider",
+        "source": (
+            "Aider leaderboard (https://aider.chat/docs/leaderboards/), "
+            "models with cost data only"
+        ),
+        "output": "pareto-aider.png",
+        "title": "LLM Pareto Frontier: Cost vs Accuracy (Aider)",
+        "xaxis_title": "Cost ($)",
+        "yaxis_title": "Accuracy (%)",
+        "score": "accuracy",
+        "equal_cost": "keep",
+        "text_size": 10,
+    },
+    {
+        "name": "kagi",
+        "source": (
+            "Kagi LLM benchmark (https://help.kagi.com/kagi/ai/llm-benchmark.html), "
+            'rows whose provider is exactly "kagi" or "kagi (ult)"'
+        ),
+        "output": "pareto-kagi.png",
+        "title": "LLM Pareto Frontier: Cost vs Accuracy (Kagi)",
+        "xaxis_title": "Cost ($)",
+        "yaxis_title": "Accuracy (%)",
+        "score": "accuracy",
+        "equal_cost": "first",
+        "text_size": 10,
+        "drop_unpriced": True,
+    },
+    {
+        "name": "livebench",
+        "source": (
+            "LiveBench Global Average scores from https://livebench.ai/ (2025-05-30)"
+        ),
+        "output": "pareto-livebench.png",
+        "title": "LLM Pareto Frontier: Cost vs LiveBench Global Score",
+        "xaxis_title": "Cost ($) - Average of Input+Output per Million Tokens",
+        "yaxis_title": "LiveBench Global Score (%)",
+        "score": "accuracy",
+        "equal_cost": "keep",
+        "text_size": 10,
+    },
+    {
+        "name": "lmarena",
+        "source": "LM Arena Elo scores from https://lmarena.ai/",
+        "output": "pareto-lmarena.png",
+        "title": "LLM Pareto Frontier: Cost vs LM Arena Elo Score",
+        "xaxis_title": "Cost ($) - Average of Input+Output per Million Tokens",
+        "yaxis_title": "LM Arena Elo Score",
+        "score": "elo_score",
+        "equal_cost": "best",
+        "text_size": 8,
+    },
+    {
+        "name": "scale-enigma-eval",
+        "source": "https://scale.com/leaderboard/enigma_eval",
+        "output": "pareto-scale-enigma-eval.png",
+        "title": "LLM Pareto Frontier: Cost vs Scale Enigma Eval Score",
+        "xaxis_title": "Cost ($) - Average of Input+Output per Million Tokens",
+        "yaxis_title": "Scale Enigma Eval Score",
+        "score": "accuracy",
+        "equal_cost": "keep",
+        "text_size": 10,
+    },
+    {
+        "name": "scale-humanitys-last-exam",
+        "source": "https://scale.com/leaderboard/humanitys_last_exam",
+        "output": "pareto-scale-humanitys-last-exam.png",
+        "title": "LLM Pareto Frontier: Cost vs Scale Humanity's Last Exam Score",
+        "xaxis_title": "Cost ($) - Average of Input+Output per Million Tokens",
+        "yaxis_title": "Scale Humanity's Last Exam Score (%)",
+        "score": "accuracy",
+        "equal_cost": "keep",
+        "text_size": 10,
+    },
+    {
+        "name": "scale-multichallenge",
+        "source": "https://scale.com/leaderboard/multichallenge",
+        "output": "pareto-scale-multichallenge.png",
+        "title": "LLM Pareto Frontier: Cost vs Scale MultiChallenge Score",
+        "xaxis_title": "Cost ($) - Average of Input+Output per Million Tokens",
+        "yaxis_title": "Scale MultiChallenge Score (%)",
+        "score": "accuracy",
+        "equal_cost": "keep",
+        "text_size": 10,
+    },
+    {
+        "name": "simplebench",
+        "source": "https://simple-bench.com/",
+        "output": "pareto-simplebench.png",
+        "title": "LLM Pareto Frontier: Cost vs SimpleBench Score",
+        "xaxis_title": "Cost ($) - Average of Input+Output per Million Tokens",
+        "yaxis_title": "SimpleBench Score (%)",
+        "score": "score",
+        "equal_cost": "best",
+        "text_size": 8,
+    },
+]
+
+CHARTS_BY_NAME = {chart["name"]: chart for chart in CHARTS}
+
+
+@functools.lru_cache(maxsize=None)
+def engine_hash():
+    """Hash the source of the modules that build every chart."""
+    digest = hashlib.sha256()
+    for name in ENGINE_FILES:
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()
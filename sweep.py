@@ -0,0 +1,199 @@
+import argparse
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+
+from charts import CHARTS, pricing_misses
+from frontier import pareto_frontier_batch
+from leaderboards import load_leaderboard
+from pricing import (
+    EFFORT_MULTIPLIERS,
+    PRICING_MODES,
+    PricingError,
+    check_misses,
+    get_pricing_store,
+)
+
+# High effort rows cost this much more than thinking rows (4x vs 2x by default)
+HIGH_TIER = EFFORT_MULTIPLIERS["high"] / EFFORT_MULTIPLIERS["thinking"]
+
+
+def parameter_grid(ratios, thinking_multipliers):
+    """Return every (input:output ratio, thinking multiplier) combination as two flat arrays."""
+    ratio_grid, thinking_grid = np.meshgrid(
+        np.asarray(ratios, dtype=float),
+        np.asarray(thinking_multipliers, dtype=float),
+        indexing="ij",
+    )
+    return ratio_grid.ravel(), thinking_grid.ravel()
+
+
+def sweep_costs(input_prices, output_prices, efforts, ratios, thinking_multipliers):
+    """Price n models under every grid combination in one pass.
+
+    `ratios` and `thinking_multipliers` are flat arrays of the same length (one
+    entry per combination). Returns a (combinations, n) cost array.
+    """
+    input_share = (ratios / (1 + ratios))[:, None]
+    blended = input_share * np.asarray(input_prices) + (1 - input_share) * np.asarray(
+        output_prices
+    )
+    efforts = np.asarray(efforts, dtype=object)
+    thinking = (efforts == "thinking") | (efforts == "high")
+    high = efforts == "high"
+    multipliers = np.where(thinking, thinking_multipliers[:, None], 1.0) * np.where(
+        high, HIGH_TIER, 1.0
+    )
+    return blended * multipliers
+
+
+def summarize_sweep(models, on_frontier, ratios, thinking_multipliers):
+    """Summarize frontier membership per model over the parameter grid.
+
+    Returns a DataFrame with the share of combinations each model is on the
+    frontier for, and the ratio and thinking multiplier ranges where it is.
+    """
+
+    def masked(values, reduce, fill):
+        grid = np.where(on_frontier, values[:, None], fill)
+        result = reduce(grid, axis=0)
+        return np.where(on_frontier.any(axis=0), result, np.nan)
+
+    return pd.DataFrame(
+        {
+            "model": models,
+            "frontier_share": on_frontier.mean(axis=0),
+            "ratio_min": masked(ratios, np.min, np.inf),
+            "ratio_max": masked(ratios, np.max, -np.inf),
+            "thinking_min": masked(thinking_multipliers, np.min, np.inf),
+            "thinking_max": masked(thinking_multipliers, np.max, -np.inf),
+        }
+    )
+
+
+def sweep_leaderboard(
+    models,
+    pricing_keys,
+    efforts,
+    scores,
+    ratios,
+    thinking_multipliers,
+    equal_cost="keep",
+    store=None,
+):
+    """Recompute a leaderboard's frontier for every grid combination and summarize it.
+
+    Models with no price in llm-prices.json are left out.
+    """
+    store = store or get_pricing_store()
+    indexes = store.indexes(pricing_keys)
+    priced = np.flatnonzero(indexes >= 0)
+    models = [models[i] for i in priced]
+    efforts = np.asarray(efforts, dtype=object)[priced]
+    scores = np.asarray(scores)[priced]
+    indexes = indexes[priced]
+    input_prices, output_prices = store.tiered_prices()
+    input_prices, output_prices = input_prices[indexes], output_prices[indexes]
+
+    costs = sweep_costs(
+        input_prices, output_prices, efforts, ratios, thinking_multipliers
+    )
+    on_frontier = pareto_frontier_batch(costs, scores, equal_cost)
+    return summarize_sweep(models, on_frontier, ratios, thinking_multipliers)
+
+
+def sweep_charts(ratios, thinking_multipliers, charts=CHARTS, pricing_mode=None):
+    """Sweep every chart priced from llm-prices.json; returns name -> summary DataFrame.
+
+    Models with no price are reported up front, in one batch for all charts,
+    as `pricing_mode` says (see `pricing.check_misses`).
+    """
+    store = get_pricing_store()
+    check_misses(pricing_misses(charts, store), pricing_mode)
+    summaries = {}
+    for chart in charts:
+        df = load_leaderboard(chart["name"])
+        if "pricing_key" not in df:
+            # The leaderboard reports its own costs, so the cost model doesn't apply
+            continue
+        summaries[chart["name"]] = sweep_leaderboard(
+            df["model"].tolist(),
+            df["pricing_key"],
+            df["effort"],
+            df[chart["score"]].to_numpy(),
+            ratios,
+            thinking_multipliers,
+            chart["equal_cost"],
+            store,
+        )
+    return summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report which models are ever on the Pareto frontier across "
+        "a grid of input:output token ratios and thinking multipliers."
+    )
+    parser.add_argument(
+        "--ratio-range",
+        nargs=2,
+        type=float,
+        default=(0.1, 10.0),
+        metavar=("MIN", "MAX"),
+        help="Input:output token ratio range, sampled log-uniformly (default: 0.1 10).",
+    )
+    parser.add_argument("--ratio-steps", type=int, default=50)
+    parser.add_argument(
+        "--thinking-range",
+        nargs=2,
+        type=float,
+        default=(1.0, 4.0),
+        metavar=("MIN", "MAX"),
+        help="Thinking cost multiplier range (default: 1 4).",
+    )
+    parser.add_argument("--thinking-steps", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print JSON output.")
+    parser.add_argument(
+        "--pricing",
+        choices=PRICING_MODES,
+        default=None,
+        help="Leave models with no price out with a warning (lenient, the "
+        "default), or stop with a report of them (strict).",
+    )
+    args = parser.parse_args()
+
+    ratios, thinking_multipliers = parameter_grid(
+        np.geomspace(*args.ratio_range, args.ratio_steps),
+        np.linspace(*args.thinking_range, args.thinking_steps),
+    )
+    try:
+        summaries = sweep_charts(
+            ratios, thinking_multipliers, pricing_mode=args.pricing
+        )
+    except PricingError as e:
+        sys.exit(str(e))
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    name: json.loads(summary.to_json(orient="records"))
+                    for name, summary in summaries.items()
+                },
+                indent=2,
+            )
+        )
+        return
+
+    print(f"{len(ratios)} parameter combinations per leaderboard")
+    for name, summary in summaries.items():
+        print(f"\n{name}")
+        ever = summary[summary["frontier_share"] > 0]
+        ever = ever.sort_values("frontier_share", ascending=False)
+        print(ever.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+
+if __name__ == "__main__":
+    main()
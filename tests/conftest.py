@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The modules live at the top of the repository rather than in a package
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,62 @@
+import sys
+import types
+
+import plotly.graph_objects as go
+import pytest
+
+from charts import export_figures, render_charts
+from specs import CHARTS_BY_NAME
+
+
+class FakeKaleido:
+    """Stands in for kaleido.Kaleido, returning errors the way kaleido 1.x does."""
+
+    exported = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def write_fig(self, fig, path=None, opts=None):
+        if "fail" in str(path):
+            return (RuntimeError("export failed"),)
+        self.exported.append((fig.layout.title.text, str(path), opts["width"]))
+        return ()
+
+
+@pytest.fixture
+def kaleido(monkeypatch):
+    FakeKaleido.exported = []
+    monkeypatch.setitem(
+        sys.modules, "kaleido", types.SimpleNamespace(Kaleido=FakeKaleido)
+    )
+    return FakeKaleido
+
+
+def test_returned_export_errors_fail_the_chart(kaleido, tmp_path):
+    chart = dict(CHARTS_BY_NAME["kagi"], output="fail.png")
+    (result,) = render_charts([chart], tmp_path, jobs=1)
+    assert result["outputs"] == []
+    assert result["error"] == "RuntimeError: export failed"
+
+
+def test_export_figures_builds_shared_figures_once(kaleido):
+    fig = go.Figure(layout=dict(title="a"))
+    results = export_figures(
+        [
+            (fig, "a.png", (1200, 800)),
+            (fig, "a-thumb.png", (300, 200)),
+            (go.Figure(layout=dict(title="b")).to_json(), "b.png", (1200, 800)),
+            (fig, "fail.png", (1200, 800)),
+        ],
+        workers=1,
+    )
+    assert [r["error"] for r in results] == [None, None, None, results[3]["error"]]
+    assert results[3]["error"] == "RuntimeError: export failed"
+    assert kaleido.exported == [
+        ("a", "a.png", 1200),
+        ("a", "a-thumb.png", 300),
+        ("b", "b.png", 1200),
+    ]
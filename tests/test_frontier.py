@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from frontier import nondominated_layers, pareto_frontier, pareto_frontier_batch
+
+
+def loop_frontier(cost, score, equal_cost):
+    """The per-script loops the sweep replaced, as sets of input positions."""
+    n = len(cost)
+    if equal_cost == "first":
+        # Kagi: the first best model at each cost, then strictly rising scores
+        best_at_cost = {}
+        for i in range(n):
+            best = best_at_cost.get(cost[i])
+            if best is None or score[i] > score[best]:
+                best_at_cost[cost[i]] = i
+        frontier, last_best = set(), -1
+        for i in sorted(best_at_cost.values(), key=lambda i: (cost[i], score[i])):
+            if score[i] > last_best:
+                frontier.add(i)
+                last_best = score[i]
+        return frontier
+
+    frontier = set()
+    for i in range(n):
+        dominated = False
+        for j in range(n):
+            # Aider and the other "keep" charts
+            if cost[j] < cost[i] and score[j] >= score[i]:
+                dominated = True
+            # Artificial Analysis and the other "best" charts
+            if equal_cost == "best" and cost[j] == cost[i] and score[j] > score[i]:
+                dominated = True
+        if not dominated:
+            frontier.add(i)
+    return frontier
+
+
+def loop_layers(points):
+    """Peel off Pareto frontiers one at a time (all objectives minimized)."""
+    ranks = np.zeros(len(points), dtype=int)
+    layer = 0
+    while (ranks == 0).any():
+        layer += 1
+        remaining = np.flatnonzero(ranks == 0)
+        for i in remaining:
+            others = points[remaining]
+            dominated = np.any(
+                np.all(others <= points[i], axis=1) & np.any(others < points[i], axis=1)
+            )
+            if not dominated:
+                ranks[i] = layer
+    return ranks
+
+
+@pytest.mark.parametrize("equal_cost", ["keep", "best", "first"])
+def test_frontier_matches_loops(equal_cost):
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        n = int(rng.integers(1, 30))
+        # Few distinct values, so ties in cost and score are common
+        cost = rng.integers(1, 8, size=n).astype(float)
+        score = rng.integers(0, 8, size=n).astype(float)
+
+        frontier, dominated_by = pareto_frontier(cost, score, equal_cost)
+        assert set(frontier.tolist()) == loop_frontier(cost, score, equal_cost)
+        assert list(cost[frontier]) == sorted(cost[frontier])
+
+        # Every dominated point names a point that really beats it
+        for i in np.flatnonzero(dominated_by >= 0):
+            j = dominated_by[i]
+            assert cost[j] <= cost[i] and score[j] >= score[i]
+
+        on_frontier = pareto_frontier_batch(cost, score, equal_cost)[0]
+        assert set(np.flatnonzero(on_frontier).tolist()) == set(frontier.tolist())
+
+
+@pytest.mark.parametrize("k", [1, 2, 3])
+def test_layers_match_peeling(k):
+    rng = np.random.default_rng(k)
+    for _ in range(100):
+        points = rng.integers(0, 6, size=(int(rng.integers(1, 40)), k)).astype(float)
+        assert (nondominated_layers(points) == loop_layers(points)).all()
+
+
+def test_layers_maximize():
+    rng = np.random.default_rng(1)
+    points = rng.integers(0, 6, size=(40, 2)).astype(float)
+    flipped = points * [1, -1]
+    assert (
+        nondominated_layers(points, maximize=[False, True]) == loop_layers(flipped)
+    ).all()
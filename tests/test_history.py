@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from history import PRICES_SERIES, HistoryStore, score_series
+
+
+def write(path, text):
+    path.write_text(text)
+    return path
+
+
+def test_as_of_returns_the_latest_snapshot(tmp_path):
+    history = HistoryStore(tmp_path / "history")
+    source = tmp_path / "scores.csv"
+    history.record("scores/x", write(source, "a"), "2025-01-01")
+    history.record("scores/x", write(source, "b"), "2025-03-01")
+
+    assert history.as_of("scores/x", "2024-12-31") is None
+    assert history.as_of("scores/x", "2025-02-28").read_text() == "a"
+    assert history.as_of("scores/x", "2025-03-01").read_text() == "b"
+    assert history.as_of("scores/x", "2026-01-01").read_text() == "b"
+
+
+def test_record_is_append_only(tmp_path):
+    history = HistoryStore(tmp_path / "history")
+    source = tmp_path / "scores.csv"
+    history.record("scores/x", write(source, "a"), "2025-03-01")
+
+    # Unchanged content isn't stored again, whatever the date
+    assert history.record("scores/x", source, "2025-01-01") is None
+    with pytest.raises(ValueError, match="different snapshot"):
+        history.record("scores/x", write(source, "b"), "2025-03-01")
+    with pytest.raises(ValueError, match="before the newest"):
+        history.record("scores/x", source, "2025-02-01")
+    assert history.dates("scores/x") == ["2025-03-01"]
+    # The index on disk agrees
+    assert HistoryStore(tmp_path / "history").dates("scores/x") == ["2025-03-01"]
+
+
+def test_record_current_dates_stale_prices_today(tmp_path):
+    history = HistoryStore(tmp_path / "history")
+    prices = tmp_path / "llm-prices.json"
+    data = {"last_updated": "2025-06-28", "models": []}
+    write(prices, json.dumps(data))
+    recorded, errors = history.record_current("2025-07-01", prices_path=prices)
+    assert not errors
+    assert recorded[score_series("aider")] is not None
+
+    # Prices edited without bumping last_updated
+    data["models"] = [
+        {
+            "provider": "p",
+            "models": [{"name": "m", "input_price": 1, "output_price": 2}],
+        }
+    ]
+    write(prices, json.dumps(data))
+    recorded, errors = history.record_current(prices_path=prices)
+    assert not errors
+    dates = history.dates(PRICES_SERIES)
+    assert dates[0] == "2025-07-01" and dates[1] > dates[0]
+
+    # An explicit backdate is refused, and the scores are still checked
+    write(prices, json.dumps(dict(data, models=[])))
+    recorded, errors = history.record_current("2025-06-01", prices_path=prices)
+    assert list(errors) == [PRICES_SERIES]
+    assert recorded[score_series("aider")] is None
@@ -0,0 +1,93 @@
+import json
+
+import numpy as np
+import pytest
+
+import pricing
+from pricing import (
+    FUZZY_THRESHOLD,
+    CostModel,
+    NameResolver,
+    PricingError,
+    PricingWarning,
+    find_misses,
+    get_model_cost,
+    get_pricing_store,
+)
+
+
+def resolver():
+    return NameResolver(list(get_pricing_store().by_name))
+
+
+def test_variant_words_must_match():
+    names = resolver()
+    (match,), _ = names.resolve(["Gemini 2.5 Flash Lite"])
+    assert match == "Gemini 2.5 Flash-Lite Preview"
+
+    scores = names.score(["Gemini 2.5 Flash Lite"])[0]
+    assert scores[names.names.index("Gemini 2.5 Flash")] < FUZZY_THRESHOLD
+
+
+def test_version_numbers_must_match():
+    _, (confidence,) = resolver().resolve(["Claude 3.7 Sonnet"])
+    assert confidence < FUZZY_THRESHOLD
+
+
+def test_run_qualifiers_are_ignored():
+    matches, confidences = resolver().resolve(
+        ["o4-Mini High", "claude-sonnet-4-20250514 (32k thinking)"]
+    )
+    assert matches == ["o4-mini", "Claude 4 Sonnet"]
+    assert (confidences >= FUZZY_THRESHOLD).all()
+
+
+def test_histogram_weights_tiers_by_tokens():
+    # One short and one long (>200k) prompt, 500 output tokens each
+    model = CostModel.from_histogram([1000, 250000], [500, 500])
+    (cost,) = model.costs(["Gemini 2.5 Pro"])
+    expected = (1000 * 1.25 + 250000 * 2.5 + 500 * 10 + 500 * 15) / 252000
+    assert cost == pytest.approx(expected)
+
+
+def test_effort_multipliers_override_some_efforts():
+    model = CostModel(effort_multipliers={"thinking": 3})
+    base, thinking, high = model.costs(["o3"] * 3, [None, "thinking", "high"])
+    assert thinking == pytest.approx(3 * base)
+    assert high == pytest.approx(4 * base)
+
+
+def test_only_checked_batches_are_cached_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(pricing, "NAME_CACHE_SIZE", 2)
+    path = tmp_path / "names.json"
+    names = NameResolver(list(get_pricing_store().by_name), path)
+    names.resolve(["o4-Mini High"])
+    assert not path.exists()
+
+    names.resolve(["o4-Mini High"], persist=True)
+    assert list(json.loads(path.read_text())) == ["o4-Mini High"]
+
+    # The oldest names make way for the newest
+    names.resolve(["Claude 3.7 Sonnet", "GPT 4o"], persist=True)
+    assert list(json.loads(path.read_text())) == ["Claude 3.7 Sonnet", "GPT 4o"]
+
+
+def test_get_model_cost_skips_the_resolver(monkeypatch):
+    def resolve(self, queries, persist=False):
+        raise AssertionError("resolved a single lookup")
+
+    monkeypatch.setattr(NameResolver, "resolve", resolve)
+    with pytest.warns(PricingWarning, match="no-such-model"):
+        assert get_model_cost("no-such-model", {}, mode="lenient") == 0
+    with pytest.raises(PricingError):
+        get_model_cost("no-such-model", {}, mode="strict")
+
+
+def test_missing_pricing_keys_are_misses():
+    store = get_pricing_store()
+    assert store.index(None) == -1
+    assert store.index(float("nan")) == -1
+    assert np.isnan(CostModel().costs(["o3", None], default=np.nan)[1])
+
+    misses = find_misses({"aa": (["A", "B"], [None, float("nan")])}, store)
+    assert [miss["pricing_key"] for miss in misses] == ["", ""]
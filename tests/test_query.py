@@ -0,0 +1,44 @@
+import pytest
+
+import query
+from misses import PricingError, PricingWarning
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(query, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(query, "_results", {})
+    return tmp_path
+
+
+def test_query_caches_rows_on_disk(cache, monkeypatch):
+    rows = query.query("aider")
+    assert [path.name.startswith("query-aider-") for path in cache.iterdir()] == [True]
+    assert [row["cost"] for row in rows] == sorted(row["cost"] for row in rows)
+    assert any(row["on_frontier"] for row in rows)
+
+    # A warm cache, on disk and then in memory, gives the same rows
+    def compute(chart):
+        raise AssertionError("recomputed a cached query")
+
+    monkeypatch.setattr(query, "compute", compute)
+    monkeypatch.setattr(query, "_results", {})
+    assert query.query("aider") == rows
+    assert query.query("aider") == rows
+
+
+def test_strict_mode_raises_on_cold_and_warm_cache(cache, monkeypatch):
+    with pytest.raises(PricingError):
+        query.query("livebench", pricing_mode="strict")
+    assert list(cache.iterdir())
+
+    with pytest.warns(PricingWarning):
+        rows = query.query("livebench", pricing_mode="lenient")
+    assert rows
+
+    monkeypatch.setattr(query, "_results", {})
+    with pytest.raises(PricingError) as raised:
+        query.query("livebench", pricing_mode="strict")
+    assert {miss["leaderboard"] for miss in raised.value.misses} == {"livebench"}
+    with pytest.raises(PricingError):
+        query.query_all(["aider", "livebench"], pricing_mode="strict")
@@ -0,0 +1,118 @@
+import warnings
+
+import numpy as np
+
+from frontier import pareto_frontier_batch
+
+DEFAULT_DRAWS = 10_000
+# Score noise when none is given, as a fraction of the leaderboard's score range
+DEFAULT_SCORE_SD = 0.02
+# Points on the cost axis the band is evaluated at
+BAND_POINTS = 200
+
+
+def resample(cost, score, score_sd, price_sd=0.0, draws=DEFAULT_DRAWS, rng=None):
+    """Draw `draws` noisy copies of a leaderboard as two (draws, n) arrays.
+
+    Scores get normal noise with standard deviation `score_sd` (a number, or
+    one per model). Prices get log-normal noise with relative spread
+    `price_sd`, so they stay positive.
+    """
+    rng = np.random.default_rng(rng)
+    cost = np.asarray(cost, dtype=float)
+    score = np.asarray(score, dtype=float)
+    scores = score + rng.normal(0.0, 1.0, (draws, len(score))) * score_sd
+    costs = np.broadcast_to(cost, scores.shape)
+    if price_sd:
+        costs = costs * np.exp(rng.normal(0.0, price_sd, scores.shape))
+    return costs, scores
+
+
+def frontier_curves(costs, scores, on_frontier, grid):
+    """Evaluate every draw's frontier line at the costs in `grid`.
+
+    The frontier is drawn as straight segments on a log-cost axis, so each
+    draw is interpolated linearly in log cost between its frontier points.
+    Returns a (draws, len(grid)) array, NaN outside a draw's frontier.
+    Free and unpriced points are left out, since a log axis can't show them.
+    """
+    draws, n = costs.shape
+    visible = on_frontier & (costs > 0)
+    hidden_cost = np.where(visible, costs, np.nan)
+
+    # Sort each draw's frontier points by cost, hidden points (NaN) last
+    order = np.argsort(hidden_cost, axis=1)
+    sorted_cost = np.take_along_axis(hidden_cost, order, 1)
+    scores = np.take_along_axis(scores, order, 1)
+    counts = visible.sum(axis=1)
+    if not counts.any():
+        return np.full((draws, len(grid)), np.nan)
+
+    # Number of frontier points at or below each grid cost: place every point
+    # on the shared grid once, then take a running count per draw
+    grid_index = np.searchsorted(grid, sorted_cost, side="left")
+    rows = np.arange(draws)[:, None]
+    placed = np.bincount(
+        (rows * (len(grid) + 1) + grid_index).ravel(),
+        minlength=draws * (len(grid) + 1),
+    )
+    right = np.cumsum(placed.reshape(draws, len(grid) + 1), axis=1)[:, :-1]
+    left = right - 1
+
+    def at(positions, values):
+        return np.take_along_axis(values, np.clip(positions, 0, n - 1), 1)
+
+    left_cost, right_cost = at(left, sorted_cost), at(right, sorted_cost)
+    left_score, right_score = at(left, scores), at(right, scores)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fraction = np.log(grid / left_cost) / np.log(right_cost / left_cost)
+        curves = left_score + fraction * (right_score - left_score)
+
+    # The last frontier point itself is on the line too
+    inside = (left >= 0) & (right < counts[:, None])
+    at_end = (left == counts[:, None] - 1) & (left_cost == grid[None, :])
+    curves = np.where(at_end, left_score, curves)
+    return np.where(inside | at_end, curves, np.nan)
+
+
+def bootstrap_frontier(
+    cost,
+    score,
+    score_sd=None,
+    price_sd=0.0,
+    draws=DEFAULT_DRAWS,
+    equal_cost="keep",
+    level=0.95,
+    rng=None,
+):
+    """Estimate how stable a leaderboard's frontier is under noisy scores and prices.
+
+    Every draw's frontier is computed in one batched sweep. Returns a dict with
+    each model's `probability` of being on the frontier, and a band around the
+    frontier line: `grid` costs with the `lower` and `upper` quantiles of the
+    frontier score at each, covering `level` of the draws.
+    """
+    cost = np.asarray(cost, dtype=float)
+    score = np.asarray(score, dtype=float)
+    if score_sd is None:
+        score_sd = DEFAULT_SCORE_SD * (score.max() - score.min())
+
+    costs, scores = resample(cost, score, score_sd, price_sd, draws, rng)
+    on_frontier = pareto_frontier_batch(costs, scores, equal_cost)
+
+    priced = cost[cost > 0]
+    grid = np.geomspace(priced.min(), priced.max(), BAND_POINTS)
+    curves = frontier_curves(costs, scores, on_frontier, grid)
+    tail = (1 - level) / 2
+    with warnings.catch_warnings():
+        # Costs no draw's frontier reaches have no quantiles
+        warnings.simplefilter("ignore", RuntimeWarning)
+        lower, upper = np.nanquantile(curves, [tail, 1 - tail], axis=0)
+
+    return {
+        "probability": on_frontier.mean(axis=0),
+        "grid": grid,
+        "lower": lower,
+        "upper": upper,
+        "level": level,
+    }